@@ -2,10 +2,95 @@
 """Command-line interface for the ultra high-level language compiler."""
 
 import argparse
+import contextlib
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
 
-from src.compiler import Compiler
+from src.ast import Program
+from src.compiler import Compiler, default_cache_dir, read_source
+
+
+def _write_program(compiler: Compiler, program: Program, out_path: str):
+    """Write the generated code to out_path through a temp file in the same directory.
+
+    The file is only replaced once code generation has finished, so a failure
+    leaves any previous output untouched instead of truncated.
+    """
+    path = Path(out_path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            compiler.codegen.write_program(program, f)
+        tmp_path.replace(path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+
+
+def _compile_one(path: str, out_path: str, cache_dir: Optional[str] = None):
+    """Compile a single file to out_path; module-level so process-pool workers can pickle it."""
+    compiler = Compiler(cache_dir=cache_dir)
+    program = compiler.parse(read_source(path))
+    _write_program(compiler, program, out_path)
+
+
+def _compile_many(inputs, output_dir: Optional[str], cache_dir: Optional[str]) -> int:
+    """Compile several files in parallel, writing each to a .py file. Returns the exit code."""
+    out_paths = []
+    claimed = {}
+    sources = {Path(in_path).resolve(): in_path for in_path in inputs}
+    for in_path in inputs:
+        out_path = Path(in_path).with_suffix(".py")
+        if output_dir:
+            out_path = Path(output_dir) / out_path.name
+        # Refuse to let an output silently overwrite an input or another output
+        resolved = out_path.resolve()
+        if resolved in sources:
+            print(
+                f"Error: compiling '{in_path}' to '{out_path}' would overwrite "
+                f"the input '{sources[resolved]}'",
+                file=sys.stderr,
+            )
+            return 1
+        if resolved in claimed:
+            print(
+                f"Error: '{claimed[resolved]}' and '{in_path}' would both be compiled "
+                f"to '{out_path}'",
+                file=sys.stderr,
+            )
+            return 1
+        claimed[resolved] = in_path
+        out_paths.append(str(out_path))
+
+    if output_dir:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    status = 0
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(_compile_one, in_path, out_path, cache_dir)
+            for in_path, out_path in zip(inputs, out_paths)
+        ]
+        for in_path, out_path, future in zip(inputs, out_paths, futures):
+            try:
+                future.result()
+            except SyntaxError as e:
+                print(f"Syntax Error in {in_path}: {e}", file=sys.stderr)
+                status = 1
+                continue
+            except Exception as e:
+                # Report every failure and move on, so one file can't hide the others' results
+                print(f"Compilation Error in {in_path}: {e}", file=sys.stderr)
+                status = 1
+                continue
+
+            print(f"Compiled successfully: {in_path} -> {out_path}", file=sys.stderr)
+
+    return status
 
 
 def main():
@@ -17,34 +102,66 @@ def main():
 Examples:
   %(prog)s input.uhl -o output.py
   %(prog)s input.uhl                    # Output to stdout
+  %(prog)s a.uhl b.uhl -o build/        # Compile several files in parallel
   echo "declare a variable named x and set it to 5" | %(prog)s -  # Read from stdin
         """,
     )
 
-    parser.add_argument("input", type=str, help='Input file (use "-" for stdin)')
+    parser.add_argument("input", type=str, nargs="+", help='Input file(s) (use "-" for stdin)')
 
     parser.add_argument(
-        "-o", "--output", type=str, default=None, help="Output file (default: stdout)"
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help=(
+            "Output file (default: stdout); with several inputs, an output directory "
+            "(default: each .py file next to its input)"
+        ),
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the parsed-AST cache in ~/.cache/uhl-compile",
     )
 
     parser.add_argument("--version", action="version", version="%(prog)s 1.0.0")
 
     args = parser.parse_args()
+    cache_dir = None if args.no_cache else str(default_cache_dir())
+
+    if len(args.input) > 1:
+        if "-" in args.input:
+            print("Error: stdin ('-') cannot be combined with other inputs", file=sys.stderr)
+            sys.exit(1)
+        for path in args.input:
+            if not Path(path).exists():
+                print(f"Error: Input file '{path}' not found", file=sys.stderr)
+                sys.exit(1)
+        sys.exit(_compile_many(args.input, args.output, cache_dir))
 
-    if args.input == "-":
+    # Single input: compile in-process, no worker pool to start up
+    input_name = args.input[0]
+    if input_name == "-":
         source_code = sys.stdin.read()
     else:
-        input_path = Path(args.input)
+        input_path = Path(input_name)
         if not input_path.exists():
-            print(f"Error: Input file '{args.input}' not found", file=sys.stderr)
+            print(f"Error: Input file '{input_name}' not found", file=sys.stderr)
             sys.exit(1)
 
-        with open(input_path, encoding="utf-8") as f:
-            source_code = f.read()
+        source_code = read_source(str(input_path))
 
-    compiler = Compiler()
+    compiler = Compiler(cache_dir=cache_dir)
     try:
-        python_code = compiler.compile(source_code)
+        program = compiler.parse(source_code)
+        # Stream the generated code straight to its destination
+        if args.output:
+            _write_program(compiler, program, args.output)
+        else:
+            compiler.codegen.write_program(program, sys.stdout)
+            sys.stdout.write("\n")
     except SyntaxError as e:
         print(f"Syntax Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -53,12 +170,7 @@ Examples:
         sys.exit(1)
 
     if args.output:
-        output_path = Path(args.output)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(python_code)
-        print(f"Compiled successfully: {args.input} -> {args.output}", file=sys.stderr)
-    else:
-        print(python_code)
+        print(f"Compiled successfully: {input_name} -> {args.output}", file=sys.stderr)
 
 
 if __name__ == "__main__":
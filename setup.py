@@ -1,5 +1,6 @@
 """Setup script for the ultra high-level language compiler."""
 
+import os
 from pathlib import Path
 
 from setuptools import find_packages, setup
@@ -7,6 +8,26 @@ from setuptools import find_packages, setup
 readme_file = Path(__file__).parent / "README.md"
 long_description = readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
 
+# Set UHL_USE_MYPYC=1 to compile the hot modules into C extensions with mypyc
+# (requires `pip install mypy`). The pure-Python package is built otherwise.
+# Compiled classes cannot be subclassed from interpreted code, so extend the
+# compiler by editing these modules rather than subclassing their classes.
+# src/ast.py stays interpreted: compiled node classes cannot be unpickled,
+# which the AST cache relies on.
+ext_modules = []
+if os.environ.get("UHL_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "--follow-imports=silent",
+            "src/lexer.py",
+            "src/narrative.py",
+            "src/parser.py",
+            "src/codegen.py",
+        ]
+    )
+
 setup(
     name="ultra-high-level-compiler",
     version="1.0.0",
@@ -18,6 +39,7 @@ setup(
     url="https://github.com/yourusername/ultra-high-level-compiler",
     packages=find_packages(),
     py_modules=["cli"],
+    ext_modules=ext_modules,
     python_requires=">=3.7",
     install_requires=[],
     entry_points={
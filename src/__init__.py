@@ -1,6 +1,7 @@
 """Ultra high-level language compiler package."""
 
+__version__ = "1.0.0"
+
 from src.compiler import Compiler
 
-__version__ = "1.0.0"
 __all__ = ["Compiler"]
@@ -1,27 +1,33 @@
 """Abstract Syntax Tree node definitions for the ultra high-level language."""
 
-from abc import ABC, abstractmethod
 from typing import Any, List, Optional
 
 
-class ASTNode(ABC):
+class ASTNode:
     """Base class for all AST nodes."""
 
-    @abstractmethod
+    # Nodes declare __slots__ so each one is a few pointers rather than a
+    # __dict__. Subclasses that leave __slots__ out just get a __dict__ back.
+    __slots__ = ()
+
+    # A plain base class rather than an ABC: node construction then skips
+    # ABCMeta's abstract-method check, which adds up over large trees.
     def accept(self, visitor):
         """Accept a visitor for code generation or other operations."""
-        pass
+        raise NotImplementedError(f"{type(self).__name__} does not implement accept()")
 
 
 class Expression(ASTNode):
     """Base class for expressions."""
 
-    pass
+    __slots__ = ()
 
 
 class Literal(Expression):
     """Represents a literal value (number, string, boolean)."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         self.value = value
 
@@ -35,6 +41,8 @@ class Literal(Expression):
 class Identifier(Expression):
     """Represents a variable identifier."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         self.name = name
 
@@ -48,6 +56,8 @@ class Identifier(Expression):
 class BinaryOp(Expression):
     """Represents a binary operation."""
 
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expression, operator: str, right: Expression):
         self.left = left
         self.operator = operator
@@ -63,6 +73,8 @@ class BinaryOp(Expression):
 class UnaryOp(Expression):
     """Represents a unary operation."""
 
+    __slots__ = ("operand", "operator")
+
     def __init__(self, operator: str, operand: Expression):
         self.operator = operator
         self.operand = operand
@@ -77,6 +89,8 @@ class UnaryOp(Expression):
 class ListLiteral(Expression):
     """Represents a list literal."""
 
+    __slots__ = ("elements",)
+
     def __init__(self, elements: List[Expression]):
         self.elements = elements
 
@@ -90,12 +104,14 @@ class ListLiteral(Expression):
 class Statement(ASTNode):
     """Base class for statements."""
 
-    pass
+    __slots__ = ()
 
 
 class VariableDeclaration(Statement):
     """Represents a variable declaration with optional type."""
 
+    __slots__ = ("name", "value", "var_type")
+
     def __init__(self, name: str, value: Expression, var_type: Optional[str] = None):
         self.name = name
         self.value = value
@@ -112,6 +128,8 @@ class VariableDeclaration(Statement):
 class Assignment(Statement):
     """Represents a variable assignment."""
 
+    __slots__ = ("name", "value")
+
     def __init__(self, name: str, value: Expression):
         self.name = name
         self.value = value
@@ -126,12 +144,14 @@ class Assignment(Statement):
 class Loop(Statement):
     """Base class for loops."""
 
-    pass
+    __slots__ = ()
 
 
 class ForLoop(Loop):
     """Represents a 'for each' loop."""
 
+    __slots__ = ("body", "item_var", "iterable")
+
     def __init__(self, item_var: str, iterable: Expression, body: List[Statement]):
         self.item_var = item_var
         self.iterable = iterable
@@ -147,6 +167,8 @@ class ForLoop(Loop):
 class WhileLoop(Loop):
     """Represents a 'while' loop."""
 
+    __slots__ = ("body", "condition")
+
     def __init__(self, condition: Expression, body: List[Statement]):
         self.condition = condition
         self.body = body
@@ -161,6 +183,8 @@ class WhileLoop(Loop):
 class RepeatLoop(Loop):
     """Represents a 'repeat N times' loop."""
 
+    __slots__ = ("body", "count")
+
     def __init__(self, count: Expression, body: List[Statement]):
         self.count = count
         self.body = body
@@ -175,6 +199,8 @@ class RepeatLoop(Loop):
 class Program(ASTNode):
     """Represents the entire program."""
 
+    __slots__ = ("statements",)
+
     def __init__(self, statements: List[Statement]):
         self.statements = statements
 
@@ -1,5 +1,8 @@
 """Python code generator from AST."""
 
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, TextIO, Type
+
 from src.ast import (
     Assignment,
     ASTNode,
@@ -10,111 +13,179 @@ from src.ast import (
     Literal,
     Program,
     RepeatLoop,
+    Statement,
     UnaryOp,
     VariableDeclaration,
     WhileLoop,
 )
 
+# Natural language type names mapped to Python type hints
+_PYTHON_TYPES = {
+    "integer": "int",
+    "int": "int",
+    "number": "float",
+    "float": "float",
+    "string": "str",
+    "str": "str",
+    "boolean": "bool",
+    "bool": "bool",
+    "list": "list",
+}
+
+# Output shapes for the statement and operator visitors, formatted with %
+_DECL_TYPED = "%s: %s = %s"
+_ASSIGN = "%s = %s"
+_FOR_HDR = "for %s in %s:"
+_WHILE_HDR = "while %s:"
+_REPEAT_HDR = "for _ in range(%s):"
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _emit_literal(value: Any) -> str:
+    """Python source for a literal value, shared across repeated constants."""
+    # repr() is already valid Python source for every literal value the
+    # parser produces (str, bool, int, float). typed=True keeps 1, 1.0 and
+    # True apart even though they hash alike.
+    return repr(value)
+
+
+# Maps each built-in node type straight to its visitor, skipping the accept()
+# double dispatch. Node types missing here still go through accept().
+_DISPATCH: Dict[Type[ASTNode], Callable[[Any, Any], Optional[str]]] = {}
+
 
 class CodeGenerator:
     """Generates Python code from AST nodes."""
 
-    def __init__(self):
-        self.indent_level = 0
-        self.indent_string = "    "
+    def __init__(self) -> None:
+        self.indent_level: int = 0
+        self.indent_string: str = "    "
+        self._indents: List[str] = [""]
+        self._buf: List[str] = []
 
-    def indent(self):
+    def indent(self) -> None:
         """Increase indentation level."""
         self.indent_level += 1
+        if self.indent_level >= len(self._indents):
+            self._indents.append(self._indents[-1] + self.indent_string)
 
-    def dedent(self):
+    def dedent(self) -> None:
         """Decrease indentation level."""
         self.indent_level = max(0, self.indent_level - 1)
 
     def get_indent(self) -> str:
         """Get the current indentation string."""
-        return self.indent_string * self.indent_level
+        return self._indents[self.indent_level]
 
     def generate(self, node: ASTNode) -> str:
         """Generate Python code from an AST node."""
-        return node.accept(self)
+        start = len(self._buf)
+        handler = _DISPATCH.get(type(node))
+        try:
+            code: Optional[str] = handler(self, node) if handler else node.accept(self)
+            if code is None:
+                # Statements write into the shared buffer instead of returning strings
+                code = "".join(self._buf[start:])
+        finally:
+            del self._buf[start:]
+        return code
+
+    def write_program(self, node: Program, out: TextIO) -> None:
+        """Write the same code as generate(node) to out, one statement at a time."""
+        buf = self._buf
+        start = len(buf)
+        separate = False
+        try:
+            for stmt in node.statements:
+                if separate:
+                    buf.append("\n")
+                body = len(buf)
+                self._emit_statement(stmt)
+                if len(buf) == body:
+                    # A statement that generates no code is skipped, separator included
+                    del buf[start:]
+                    continue
+                separate = True
+                # Hand the statement's chunks to the stream as-is, without joining them first
+                out.writelines(buf[start:])
+                del buf[start:]
+        finally:
+            del buf[start:]
+
+    def _emit(self, text: str) -> None:
+        """Append a chunk of output to the shared buffer."""
+        self._buf.append(text)
+
+    def _emit_block(self, body: List[Statement]) -> None:
+        """Emit the statements of a loop body one indentation level deeper."""
+        self.indent()
+        indent = self.get_indent()
+        for stmt in body:
+            self._buf.append("\n")
+            self._buf.append(indent)
+            self._emit_statement(stmt)
+        self.dedent()
+
+    def _emit_statement(self, stmt: Statement) -> None:
+        """Emit one statement into the shared buffer."""
+        handler = _DISPATCH.get(type(stmt))
+        code = handler(self, stmt) if handler else stmt.accept(self)
+        if code:
+            # Visitors added outside this module may still return their code
+            self._buf.append(code)
 
-    def visit_program(self, node: Program) -> str:
+    def visit_program(self, node: Program) -> None:
         """Generate code for a program."""
-        lines = []
+        buf = self._buf
+        separate = False
         for stmt in node.statements:
-            code = self.generate(stmt)
-            if code:
-                lines.append(code)
-        return "\n".join(lines)
-
-    def visit_variable_declaration(self, node: VariableDeclaration) -> str:
+            mark = len(buf)
+            if separate:
+                buf.append("\n")
+            start = len(buf)
+            self._emit_statement(stmt)
+            if len(buf) == start:
+                # A statement that generates no code is skipped, separator included
+                del buf[mark:]
+            else:
+                separate = True
+
+    def visit_variable_declaration(self, node: VariableDeclaration) -> None:
         """Generate code for a variable declaration."""
         value_code = self.generate(node.value)
 
         if node.var_type:
             type_hint = self._python_type(node.var_type)
-            return f"{node.name}: {type_hint} = {value_code}"
+            self._emit(_DECL_TYPED % (node.name, type_hint, value_code))
         else:
-            return f"{node.name} = {value_code}"
+            self._emit(_ASSIGN % (node.name, value_code))
 
-    def visit_assignment(self, node: Assignment) -> str:
+    def visit_assignment(self, node: Assignment) -> None:
         """Generate code for an assignment."""
         value_code = self.generate(node.value)
-        return f"{node.name} = {value_code}"
+        self._emit(_ASSIGN % (node.name, value_code))
 
-    def visit_for_loop(self, node: ForLoop) -> str:
+    def visit_for_loop(self, node: ForLoop) -> None:
         """Generate code for a for loop."""
         iterable_code = self.generate(node.iterable)
-        lines = [f"for {node.item_var} in {iterable_code}:"]
+        self._emit(_FOR_HDR % (node.item_var, iterable_code))
+        self._emit_block(node.body)
 
-        self.indent()
-        for stmt in node.body:
-            stmt_code = self.generate(stmt)
-            if stmt_code:
-                lines.append(self.get_indent() + stmt_code)
-        self.dedent()
-
-        return "\n".join(lines)
-
-    def visit_while_loop(self, node: WhileLoop) -> str:
+    def visit_while_loop(self, node: WhileLoop) -> None:
         """Generate code for a while loop."""
         condition_code = self.generate(node.condition)
-        lines = [f"while {condition_code}:"]
-
-        self.indent()
-        for stmt in node.body:
-            stmt_code = self.generate(stmt)
-            if stmt_code:
-                lines.append(self.get_indent() + stmt_code)
-        self.dedent()
-
-        return "\n".join(lines)
+        self._emit(_WHILE_HDR % condition_code)
+        self._emit_block(node.body)
 
-    def visit_repeat_loop(self, node: RepeatLoop) -> str:
+    def visit_repeat_loop(self, node: RepeatLoop) -> None:
         """Generate code for a repeat loop."""
         count_code = self.generate(node.count)
-        lines = [f"for _ in range({count_code}):"]
-
-        self.indent()
-        for stmt in node.body:
-            stmt_code = self.generate(stmt)
-            if stmt_code:
-                lines.append(self.get_indent() + stmt_code)
-        self.dedent()
-
-        return "\n".join(lines)
+        self._emit(_REPEAT_HDR % count_code)
+        self._emit_block(node.body)
 
     def visit_literal(self, node: Literal) -> str:
         """Generate code for a literal."""
-        if isinstance(node.value, str):
-            return repr(node.value)
-        elif isinstance(node.value, bool):
-            return "True" if node.value else "False"
-        elif isinstance(node.value, (int, float)):
-            return str(node.value)
-        else:
-            return repr(node.value)
+        return _emit_literal(node.value)
 
     def visit_list_literal(self, node: ListLiteral) -> str:
         """Generate code for a list literal."""
@@ -127,50 +198,56 @@ class CodeGenerator:
 
     def visit_binary_op(self, node: BinaryOp) -> str:
         """Generate code for a binary operation."""
-        left_code = self.generate(node.left)
-        right_code = self.generate(node.right)
-
-        op_map = {
-            "and": "and",
-            "or": "or",
-            "==": "==",
-            "!=": "!=",
-            "<": "<",
-            ">": ">",
-            "<=": "<=",
-            ">=": ">=",
-            "+": "+",
-            "-": "-",
-            "*": "*",
-            "/": "/",
-        }
-
-        op = op_map.get(node.operator, node.operator)
-
-        return f"{left_code} {op} {right_code}"
+        return self._emit_operators(node)
 
     def visit_unary_op(self, node: UnaryOp) -> str:
         """Generate code for a unary operation."""
-        operand_code = self.generate(node.operand)
-
-        if node.operator == "not":
-            return f"not {operand_code}"
-        elif node.operator == "-":
-            return f"-{operand_code}"
-        else:
-            return f"{node.operator}{operand_code}"
+        return self._emit_operators(node)
+
+    def _emit_operators(self, node: ASTNode) -> str:
+        """Generate code for a tree of binary and unary operations without recursing.
+
+        Operator chains come out of the parser as deep trees (a left-deep
+        BinaryOp per operand), so they are walked with an explicit stack of
+        nodes and finished text, in output order; other operands go through
+        generate() as usual. The root is always expanded here, even when it is
+        a subclass, since generate() would only bring it back to this method.
+        """
+        parts: List[str] = []
+        stack: List[Any] = [node]
+        while stack:
+            item = stack.pop()
+            item_type = type(item)
+            if item_type is str:
+                parts.append(item)
+            elif item_type is BinaryOp or (item is node and isinstance(item, BinaryOp)):
+                stack.append(item.right)
+                stack.append(" " + item.operator + " ")
+                stack.append(item.left)
+            elif item_type is UnaryOp or (item is node and isinstance(item, UnaryOp)):
+                stack.append(item.operand)
+                stack.append("not " if item.operator == "not" else item.operator)
+            else:
+                parts.append(self.generate(item))
+        return "".join(parts)
 
     def _python_type(self, type_name: str) -> str:
         """Convert natural language type to Python type hint."""
-        type_map = {
-            "integer": "int",
-            "int": "int",
-            "number": "float",
-            "float": "float",
-            "string": "str",
-            "str": "str",
-            "boolean": "bool",
-            "bool": "bool",
-            "list": "list",
-        }
-        return type_map.get(type_name.lower(), "Any")
+        return _PYTHON_TYPES.get(type_name.lower(), "Any")
+
+
+_DISPATCH.update(
+    {
+        Program: CodeGenerator.visit_program,
+        VariableDeclaration: CodeGenerator.visit_variable_declaration,
+        Assignment: CodeGenerator.visit_assignment,
+        ForLoop: CodeGenerator.visit_for_loop,
+        WhileLoop: CodeGenerator.visit_while_loop,
+        RepeatLoop: CodeGenerator.visit_repeat_loop,
+        Literal: CodeGenerator.visit_literal,
+        ListLiteral: CodeGenerator.visit_list_literal,
+        Identifier: CodeGenerator.visit_identifier,
+        BinaryOp: CodeGenerator.visit_binary_op,
+        UnaryOp: CodeGenerator.visit_unary_op,
+    }
+)
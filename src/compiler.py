@@ -1,17 +1,93 @@
 """Main compiler orchestrator."""
 
+import contextlib
+import functools
+import hashlib
+import mmap
+import os
+import pickle
+from pathlib import Path
+from typing import Optional, TextIO
+
+from src import __version__
+from src import ast as ast_module
+from src import lexer as lexer_module
+from src import narrative as narrative_module
+from src import parser as parser_module
+from src.ast import Program
 from src.codegen import CodeGenerator
 from src.lexer import Lexer
 from src.parser import Parser
 
+# Source files at least this large are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD = 64 * 1024
+
+# Modules whose code decides what a source parses to; part of every AST cache key
+_AST_CACHE_MODULES = (ast_module, lexer_module, narrative_module, parser_module)
+
+# Length of the SHA-256 digest that prefixes every AST cache entry
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+@functools.lru_cache(maxsize=None)
+def ast_cache_key() -> str:
+    """
+    Return the part of every AST cache key that identifies this compiler.
+
+    It hashes the package version and the files of the modules that produce
+    the tree, so editing the lexer, parser or AST classes (or installing
+    another build of them) never reuses trees cached by the old code.
+    """
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    for module in _AST_CACHE_MODULES:
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user directory for cached ASTs."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "uhl-compile"
+
+
+def read_source(file_path: str) -> str:
+    """
+    Read a source file as text with universal newlines.
+
+    Large files are decoded straight from a read-only memory map, which avoids
+    holding an extra copy of the raw bytes while decoding.
+
+    Args:
+        file_path: Path to the source file
+
+    Returns:
+        The file contents
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            text = f.read().decode("utf-8")
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, "utf-8")
+
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
 
 class Compiler:
     """Main compiler class that orchestrates lexing, parsing, and code generation."""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Directory for caching parsed ASTs by source hash, so
+                unchanged sources skip lexing and parsing. Caching is off if None.
+        """
         self.lexer = None
         self.parser = None
         self.codegen = CodeGenerator()
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
     def compile(self, source_code: str) -> str:
         """
@@ -26,15 +102,49 @@ class Compiler:
         Raises:
             SyntaxError: If there's a syntax error in the source code
         """
-        self.lexer = Lexer(source_code)
-        tokens = self.lexer.tokenize()
+        return self.codegen.generate(self.parse(source_code))
 
-        self.parser = Parser(tokens)
-        ast = self.parser.parse()
+    def compile_to(self, source_code: str, out: TextIO):
+        """
+        Compile source code and write the Python code to a text stream.
 
-        python_code = self.codegen.generate(ast)
+        The output is the same as compile() returns, written one statement at
+        a time so the whole output never has to be held as one string.
 
-        return python_code
+        Args:
+            source_code: The source code in the ultra high-level language
+            out: Stream to write the generated Python code to
+
+        Raises:
+            SyntaxError: If there's a syntax error in the source code
+        """
+        self.codegen.write_program(self.parse(source_code), out)
+
+    def parse(self, source_code: str) -> Program:
+        """
+        Lex and parse source code, using the AST cache when enabled.
+
+        Args:
+            source_code: The source code in the ultra high-level language
+
+        Returns:
+            The parsed program
+
+        Raises:
+            SyntaxError: If there's a syntax error in the source code
+        """
+        ast = self._load_cached_ast(source_code) if self.cache_dir else None
+        if ast is None:
+            self.lexer = Lexer(source_code)
+            tokens = self.lexer.tokenize()
+
+            self.parser = Parser(tokens)
+            ast = self.parser.parse()
+
+            if self.cache_dir:
+                self._store_cached_ast(source_code, ast)
+
+        return ast
 
     def compile_file(self, file_path: str) -> str:
         """
@@ -46,7 +156,44 @@ class Compiler:
         Returns:
             Generated Python code
         """
-        with open(file_path, encoding="utf-8") as f:
-            source_code = f.read()
+        return self.compile(read_source(file_path))
+
+    def _cache_path(self, source_code: str) -> Path:
+        """Get the cache file for a source string."""
+        digest = hashlib.sha256(source_code.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}-{ast_cache_key()}.ast.pkl"
+
+    def _load_cached_ast(self, source_code: str) -> Optional[Program]:
+        """Load a cached AST for the source, or return None on a miss.
+
+        An entry is the SHA-256 digest of the pickled tree followed by the
+        pickle itself; entries whose digest doesn't match are never unpickled.
+        """
+        try:
+            data = self._cache_path(source_code).read_bytes()
+        except OSError:
+            return None
+        digest, payload = data[:_DIGEST_SIZE], data[_DIGEST_SIZE:]
+        if hashlib.sha256(payload).digest() != digest:
+            return None
+        try:
+            ast = pickle.loads(payload)
+        except Exception:
+            # Any failure to rebuild the tree is just a cache miss
+            return None
+        return ast if isinstance(ast, Program) else None
 
-        return self.compile(source_code)
+    def _store_cached_ast(self, source_code: str, ast: Program):
+        """Cache an AST for the source. Failures leave the cache untouched."""
+        path = self._cache_path(source_code)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            payload = pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("wb") as f:
+                f.write(hashlib.sha256(payload).digest())
+                f.write(payload)
+            tmp_path.replace(path)
+        except (OSError, pickle.PicklingError, RecursionError):
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
@@ -1,44 +1,13 @@
 """Lexer for tokenizing natural language input."""
 
-from enum import Enum
-from typing import List, Optional
-
-
-class TokenType(Enum):
-    """Token types for the lexer."""
-
-    KEYWORD = "KEYWORD"
-    IDENTIFIER = "IDENTIFIER"
-    NUMBER = "NUMBER"
-    STRING = "STRING"
-    OPERATOR = "OPERATOR"
-    PUNCTUATION = "PUNCTUATION"
-    PARAGRAPH_BREAK = "PARAGRAPH_BREAK"
-    EOF = "EOF"
-
-
-class Token:
-    """Represents a token with type, value, and position."""
-
-    def __init__(self, token_type: TokenType, value: str, line: int = 1, column: int = 1):
-        self.type = token_type
-        self.value = value
-        self.line = line
-        self.column = column
-
-    def __repr__(self):
-        return f"Token({self.type.name}, {self.value!r}, line={self.line}, col={self.column})"
-
-    def __eq__(self, other):
-        if not isinstance(other, Token):
-            return False
-        return self.type == other.type and self.value == other.value
-
-
-class Lexer:
-    """Tokenizes natural language input into tokens."""
-
-    KEYWORDS = {
+import re
+import sys
+from enum import IntEnum
+from typing import List, NoReturn, Optional, Union
+
+# Reserved words, stored lowercased; identifiers are matched case-insensitively.
+KEYWORDS = frozenset(
+    {
         "declare",
         "variable",
         "named",
@@ -90,199 +59,205 @@ class Lexer:
         "create",
         "now",
     }
+)
+
+# Small integer id for each keyword, so callers can classify keyword tokens
+# with table lookups instead of string comparisons.
+KEYWORD_IDS = {word: kw_id for kw_id, word in enumerate(sorted(KEYWORDS))}
+
+
+# Building blocks for the scanner
+_WS_RE = re.compile(r"\s+")
+_STRING_RE = re.compile(r""""(?:\\[\s\S]|[^"\\])*"|'(?:\\[\s\S]|[^'\\])*'""")
+_ESCAPE_RE = re.compile(r"\\([\s\S])")
+
+# One alternative per token class; anything left over is reported as an error.
+_MASTER_RE = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern})"
+        for name, pattern in (
+            ("WS", _WS_RE.pattern),
+            ("COMMENT", r"\#[^\n]*\n?"),
+            ("NUMBER", r"\d+(?:\.\d*)?"),
+            ("STRING", _STRING_RE.pattern),
+            ("IDENT", r"[^\W\d]\w*"),
+            ("OPERATOR", r"==|!=|<=|>=|[-+*/<>=]"),
+            ("PUNCTUATION", r"[,.;:()\[\]{}]"),
+            ("ERROR", r"[\s\S]"),
+        )
+    )
+)
+
+# Group numbers of the alternatives above; the scanner branches on
+# match.lastindex, a small int, rather than on the group name.
+_WS = _MASTER_RE.groupindex["WS"]
+_COMMENT = _MASTER_RE.groupindex["COMMENT"]
+_NUMBER = _MASTER_RE.groupindex["NUMBER"]
+_STRING = _MASTER_RE.groupindex["STRING"]
+_IDENT = _MASTER_RE.groupindex["IDENT"]
+_OPERATOR = _MASTER_RE.groupindex["OPERATOR"]
+_PUNCTUATION = _MASTER_RE.groupindex["PUNCTUATION"]
+
+
+class TokenType(IntEnum):
+    """Token types for the lexer."""
 
-    OPERATORS = {"+", "-", "*", "/", "==", "!=", "<=", ">=", "<", ">", "and", "or", "not"}
-
-    def __init__(self, text: str):
-        self.text = text
-        self.pos = 0
-        self.line = 1
-        self.column = 1
-        self.tokens: List[Token] = []
-
-    def error(self, message: str):
-        """Raise a lexer error with position information."""
-        raise SyntaxError(f"Lexer error at line {self.line}, column {self.column}: {message}")
-
-    def current_char(self) -> Optional[str]:
-        """Get the current character."""
-        if self.pos >= len(self.text):
-            return None
-        return self.text[self.pos]
-
-    def peek_char(self, offset: int = 1) -> Optional[str]:
-        """Peek at a character ahead."""
-        pos = self.pos + offset
-        if pos >= len(self.text):
-            return None
-        return self.text[pos]
-
-    def advance(self):
-        """Move to the next character."""
-        if self.pos < len(self.text) and self.text[self.pos] == "\n":
-            self.line += 1
-            self.column = 1
-        else:
-            self.column += 1
-        self.pos += 1
-
-    def skip_whitespace(self):
-        """Skip whitespace characters."""
-        while self.pos < len(self.text) and self.text[self.pos].isspace():
-            self.advance()
-
-    def skip_comment(self):
-        """Skip comment lines (lines starting with #)."""
-        if self.current_char() == "#":
-            while self.pos < len(self.text) and self.text[self.pos] != "\n":
-                self.advance()
-            if self.pos < len(self.text):
-                self.advance()
-
-    def read_number(self) -> str:
-        """Read a number (integer or float)."""
-        result = []
-        has_dot = False
-
-        while self.pos < len(self.text):
-            char = self.text[self.pos]
-            if char.isdigit():
-                result.append(char)
-                self.advance()
-            elif char == "." and not has_dot:
-                result.append(char)
-                has_dot = True
-                self.advance()
-            else:
-                break
-
-        return "".join(result)
-
-    def read_string(self) -> str:
-        """Read a string literal."""
-        quote_char = self.current_char()
-        self.advance()
-
-        result = []
-        while self.pos < len(self.text):
-            char = self.text[self.pos]
-            if char == quote_char:
-                self.advance()
-                break
-            elif char == "\\":
-                self.advance()
-                if self.pos < len(self.text):
-                    result.append(self.text[self.pos])
-                    self.advance()
-            else:
-                result.append(char)
-                self.advance()
-        else:
-            self.error("Unterminated string literal")
-
-        return "".join(result)
-
-    def read_identifier_or_keyword(self) -> str:
-        """Read an identifier or keyword."""
-        result = []
+    KEYWORD = 1
+    IDENTIFIER = 2
+    NUMBER = 3
+    STRING = 4
+    OPERATOR = 5
+    PUNCTUATION = 6
+    PARAGRAPH_BREAK = 7
+    EOF = 8
 
-        while self.pos < len(self.text):
-            char = self.text[self.pos]
-            if char.isalnum() or char == "_":
-                result.append(char)
-                self.advance()
-            else:
-                break
 
-        return "".join(result)
+class Token:
+    """Represents a token with type, value, and position."""
 
-    def read_operator(self) -> str:
-        """Read an operator."""
-        char = self.current_char()
+    __slots__ = ("column", "kw_id", "line", "number", "type", "value", "value_lower")
+
+    def __init__(
+        self,
+        token_type: TokenType,
+        value: str,
+        line: int = 1,
+        column: int = 1,
+        value_lower: Optional[str] = None,
+    ):
+        self.type: TokenType = token_type
+        self.value: str = value
+        # The parser matches words case-insensitively; lowercase once up front.
+        # Keywords are interned (the scanner already passes them that way), so
+        # a keyword token's value_lower can be compared with "is".
+        if value_lower is None:
+            value_lower = value.lower()
+            if token_type == TokenType.KEYWORD:
+                value_lower = sys.intern(value_lower)
+        self.value_lower: str = value_lower
+        # Index into KEYWORD_IDS for keyword tokens, -1 for everything else
+        self.kw_id: int = (
+            KEYWORD_IDS.get(value_lower, -1) if token_type == TokenType.KEYWORD else -1
+        )
+        # Numeric value of a NUMBER token ("5." is a float), None for everything else
+        self.number: Optional[Union[int, float]] = (
+            (float(value) if "." in value else int(value))
+            if token_type is TokenType.NUMBER
+            else None
+        )
+        self.line: int = line
+        self.column: int = column
+
+    def __repr__(self) -> str:
+        return f"Token({self.type.name}, {self.value!r}, line={self.line}, col={self.column})"
 
-        if self.pos + 1 < len(self.text):
-            two_char = char + self.text[self.pos + 1]
-            if two_char in ("==", "!=", "<=", ">="):
-                self.advance()
-                self.advance()
-                return two_char
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Token):
+            return False
+        # Keyword, operator and punctuation values are interned by the lexer
+        return self.type is other.type and (self.value is other.value or self.value == other.value)
 
-        if char in ("+", "-", "*", "/", "<", ">", "="):
-            self.advance()
-            return char
 
-        return ""
+class Lexer:
+    """Tokenizes natural language input into tokens."""
 
-    def check_paragraph_break(self) -> bool:
-        """Check if there's a paragraph break (double newline or empty line)."""
-        if self.current_char() == "\n":
-            start_pos = self.pos
-            while self.pos < len(self.text) and self.text[self.pos].isspace():
-                self.advance()
+    KEYWORDS = KEYWORDS
 
-            if self.pos >= len(self.text) or self.text[self.pos] == "\n":
-                return True
+    OPERATORS = {"+", "-", "*", "/", "==", "!=", "<=", ">=", "<", ">", "and", "or", "not"}
 
-            self.pos = start_pos
-            self.column = 1
+    def __init__(self, text: str):
+        self.text: str = text
+        self.pos: int = 0
+        self.line: int = 1
+        self.column: int = 1
+        self.tokens: List[Token] = []
 
-        return False
+    def error(self, message: str) -> NoReturn:
+        """Raise a lexer error with position information."""
+        raise SyntaxError(f"Lexer error at line {self.line}, column {self.column}: {message}")
 
-    def tokenize(self) -> List[Token]:
+    # One flat loop on purpose: this runs once per token, and splitting the
+    # branches into helpers would add a call per token
+    def tokenize(self) -> List[Token]:  # noqa: PLR0912, PLR0915
         """Tokenize the input text."""
         self.tokens = []
-
-        while self.pos < len(self.text):
-            if self.current_char().isspace():
-                if self.check_paragraph_break():
-                    self.tokens.append(
-                        Token(TokenType.PARAGRAPH_BREAK, "\n\n", self.line, self.column)
-                    )
-                    continue
-                self.skip_whitespace()
-                continue
-
-            if self.current_char() == "#":
-                self.skip_comment()
+        text = self.text
+        tokens = self.tokens
+        keywords = KEYWORDS
+        intern = sys.intern
+        line = 1
+        line_start = 0
+
+        for match in _MASTER_RE.finditer(text):
+            kind = match.lastindex
+            start = match.start()
+
+            if kind == _WS:
+                end = match.end()
+                newlines = text.count("\n", start, end)
+                if newlines:
+                    # Only a run that starts on a newline and reaches the end of
+                    # the input counts as a paragraph break.
+                    is_break = text[start] == "\n" and end == len(text)
+                    line += newlines
+                    line_start = text.rindex("\n", start, end) + 1
+                    if is_break:
+                        tokens.append(
+                            Token(
+                                TokenType.PARAGRAPH_BREAK,
+                                "\n\n",
+                                line,
+                                end - line_start + 1,
+                                "\n\n",
+                            )
+                        )
                 continue
 
-            char = self.current_char()
-            start_line = self.line
-            start_col = self.column
-
-            if char.isdigit():
-                value = self.read_number()
-                self.tokens.append(Token(TokenType.NUMBER, value, start_line, start_col))
-                continue
-
-            if char in ('"', "'"):
-                value = self.read_string()
-                self.tokens.append(Token(TokenType.STRING, value, start_line, start_col))
-                continue
+            column = start - line_start + 1
 
-            if char.isalpha() or char == "_":
-                value = self.read_identifier_or_keyword()
-                if value.lower() in self.KEYWORDS:
-                    self.tokens.append(
-                        Token(TokenType.KEYWORD, value.lower(), start_line, start_col)
-                    )
+            if kind == _IDENT:
+                value = match.group()
+                lowered = value if value.isascii() and value.islower() else value.lower()
+                if lowered in keywords:
+                    lowered = intern(lowered)
+                    tokens.append(Token(TokenType.KEYWORD, lowered, line, column, lowered))
                 else:
-                    self.tokens.append(Token(TokenType.IDENTIFIER, value, start_line, start_col))
-                continue
-
-            if char in ("+", "-", "*", "/", "=", "<", ">", "!"):
-                op = self.read_operator()
-                if op:
-                    self.tokens.append(Token(TokenType.OPERATOR, op, start_line, start_col))
-                    continue
-
-            if char in (",", ".", ";", ":", "(", ")", "[", "]", "{", "}"):
-                self.tokens.append(Token(TokenType.PUNCTUATION, char, start_line, start_col))
-                self.advance()
-                continue
-
-            self.error(f"Unexpected character: {char!r}")
-
-        self.tokens.append(Token(TokenType.EOF, "", self.line, self.column))
+                    tokens.append(Token(TokenType.IDENTIFIER, value, line, column, lowered))
+            elif kind == _NUMBER:
+                value = match.group()
+                tokens.append(Token(TokenType.NUMBER, value, line, column, value))
+            elif kind == _OPERATOR:
+                value = intern(match.group())
+                tokens.append(Token(TokenType.OPERATOR, value, line, column, value))
+            elif kind == _PUNCTUATION:
+                value = intern(match.group())
+                tokens.append(Token(TokenType.PUNCTUATION, value, line, column, value))
+            elif kind == _STRING:
+                body = match.group()[1:-1]
+                if "\\" in body:
+                    body = _ESCAPE_RE.sub(r"\1", body)
+                tokens.append(Token(TokenType.STRING, body, line, column, body.lower()))
+                end = match.end()
+                newlines = text.count("\n", start, end)
+                if newlines:
+                    line += newlines
+                    line_start = text.rindex("\n", start, end) + 1
+            elif kind == _COMMENT:
+                if text.endswith("\n", start, match.end()):
+                    line += 1
+                    line_start = match.end()
+            else:
+                self.pos = start
+                self.line = line
+                self.column = column
+                char = match.group()
+                if char in ('"', "'"):
+                    self.error("Unterminated string literal")
+                self.error(f"Unexpected character: {char!r}")
+
+        self.pos = len(text)
+        self.line = line
+        self.column = self.pos - line_start + 1
+        tokens.append(Token(TokenType.EOF, "", self.line, self.column, ""))
 
-        return self.tokens
+        return tokens
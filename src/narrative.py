@@ -0,0 +1,467 @@
+"""Skipping of narrative words in front of statements.
+
+Kept apart from the parser so the opt-in mypyc build can compile this hot
+loop on its own; it works on the token list and a position only.
+"""
+
+import re
+from typing import FrozenSet, List
+
+from src.lexer import KEYWORD_IDS, Token, TokenType
+
+# Keywords that start actual statements
+_STATEMENT_STARTERS = frozenset(
+    {
+        "declare",
+        "create",
+        "set",
+        "for",
+        "while",
+        "repeat",
+        "if",
+        "else",
+    }
+)
+
+# Keywords that are part of statements (should not be skipped)
+# Note: "now", "to", "is", "and", and "each" are not included here because they can be narrative (handled separately)
+_STATEMENT_KEYWORDS = frozenset(
+    {
+        "variable",
+        "named",
+        "called",
+        "as",
+        "it",
+        "or",
+        "not",
+        "in",
+        "do",
+        "true",
+        "false",
+        "times",
+        "equals",
+        "becomes",
+        "become",
+        "plus",
+        "minus",
+        "divided",
+        "greater",
+        "than",
+        "less",
+        "equal",
+    }
+)
+
+# Narrative words (and, by prefix, their verb forms) skipped before a statement
+_BASE_NARRATIVE_WORDS = frozenset(
+    {
+        "let",
+        "me",
+        "start",
+        "by",
+        "now",
+        "first",
+        "then",
+        "next",
+        "also",
+        "we",
+        "want",
+        "need",
+        "will",
+        "can",
+        "should",
+        "shall",
+        "must",
+        "after",
+        "before",
+        "during",
+        "finally",
+        "later",
+        "on",
+        "once",
+        "this",
+        "that",
+        "these",
+        "those",
+        "so",
+        "which",
+        "who",
+        "what",
+        "when",
+        "where",
+        "why",
+        "how",
+        "whether",
+        "some",
+        "any",
+        "every",
+        "all",
+        "both",
+        "either",
+        "neither",
+        "another",
+        "other",
+        "such",
+        "same",
+        "different",
+        "new",
+        "old",
+        "last",
+        "be",
+        "our",
+        "their",
+        "my",
+        "your",
+        "his",
+        "her",
+        "its",
+        "us",
+        "them",
+        "they",
+        "he",
+        "she",
+        "it",
+        "i",
+        "make",
+        "makes",
+        "made",
+        "point",
+        "way",
+        "thing",
+        "things",
+        "one",
+        "ones",
+        "here",
+        "there",
+        "up",
+        "down",
+        "out",
+        "in",
+        "off",
+        "over",
+        "under",
+        "through",
+        "the",
+        "track",
+        "something",
+        "active",
+        "greet",
+        "user",
+        "properly",
+        "update",
+        "and",
+        "list",
+        "contains",
+        "numbers",
+        "work",
+        "with",
+        "do",
+        "of",
+        "each",
+        "calculate",
+        "square",
+        "adding",
+        "result",
+        "processing",
+        "set",
+        "counter",
+        "increment",
+        "time",
+        "loop",
+        "specific",
+        "times",
+        "iteration",
+        "change",
+        "demonstrates",
+        "assignment",
+        "number",
+        "variable",
+        "called",
+        "perform",
+        "calculations",
+        "multiply",
+        "together",
+        "subtraction",
+        "division",
+        "compare",
+        "values",
+        "larger",
+        "similarly",
+        "check",
+        "equality",
+        "combine",
+        "operations",
+        "logical",
+        "met",
+        "build",
+        "program",
+        "calculates",
+        "statistics",
+        "from",
+        "hold",
+        "running",
+        "sum",
+        "iterate",
+        "accumulate",
+        "added",
+        "add",
+        "average",
+        "mean",
+        "value",
+        "task",
+        "count",
+        "conditions",
+        "reached",
+        "threshold",
+        "transformation",
+        "use",
+    }
+)
+
+# Matches any word starting with a narrative word, for their verb forms; one
+# compiled alternation is cheaper than a startswith() over every prefix
+_NARRATIVE_PREFIX_RE = re.compile("|".join(map(re.escape, sorted(_BASE_NARRATIVE_WORDS))))
+
+# Words after which "a" is treated as narrative, as in "from a list"
+_NARRATIVE_PRECEDERS = frozenset(
+    {
+        "from",
+        "to",
+        "with",
+        "in",
+        "on",
+        "at",
+        "for",
+        "of",
+        "by",
+        "about",
+        "into",
+        "onto",
+        "upon",
+    }
+)
+
+
+def is_narrative_word(word: str) -> bool:
+    """Check if a lowercased word is a narrative word, including verb forms."""
+    if word in _BASE_NARRATIVE_WORDS:
+        return True
+    # Don't skip exact statement starters - they're needed for matching
+    if word in _STATEMENT_STARTERS:
+        return False
+    # Check verb forms of narrative words (but not statement starters).
+    # Exact matches returned above, so any prefix match here is a longer word.
+    return _NARRATIVE_PREFIX_RE.match(word) is not None
+
+
+# Per-keyword flags, indexed by Token.kw_id
+_STARTER = 1
+_STATEMENT_KEYWORD = 2
+_NARRATIVE = 4
+
+
+def _build_keyword_flags() -> bytearray:
+    """Classify every keyword once, so keyword tokens need no string checks."""
+    flags = bytearray(len(KEYWORD_IDS))
+    for word, kw_id in KEYWORD_IDS.items():
+        flags[kw_id] = (
+            (_STARTER if word in _STATEMENT_STARTERS else 0)
+            | (_STATEMENT_KEYWORD if word in _STATEMENT_KEYWORDS else 0)
+            | (_NARRATIVE if is_narrative_word(word) else 0)
+        )
+    return flags
+
+
+_KW_FLAGS = _build_keyword_flags()
+_KW_A = KEYWORD_IDS["a"]
+_KW_EACH = KEYWORD_IDS["each"]
+_KW_TO = KEYWORD_IDS["to"]
+_KW_WHILE = KEYWORD_IDS["while"]
+_KW_IT = KEYWORD_IDS["it"]
+_KW_NOW = KEYWORD_IDS["now"]
+_KW_AND = KEYWORD_IDS["and"]
+_KW_DO = KEYWORD_IDS["do"]
+
+
+# Words after "a" that make it part of a declaration, as in "a variable"
+_DECLARATION_WORDS = frozenset({"variable", "list", "string", "integer", "number", "boolean"})
+
+# Words after an identifier that make it the target of an assignment
+_ASSIGN_OPS = frozenset({"equals", "=", "becomes", "become"})
+_ASSIGN_OPS_WITH_IS = _ASSIGN_OPS | {"is"}
+
+# Punctuation skipped along with narrative words
+_SKIPPED_PUNCTUATION = frozenset({",", ".", ";", ":"})
+
+# Context words for the lookback checks in skip_narrative
+_SET_WORDS = frozenset({"set"})
+_IS_WORDS = frozenset({"is"})
+_LOOP_WORDS = frozenset({"for", "while", "repeat", "each"})
+
+
+def _recent_index(tokens: List[Token], pos: int, words: FrozenSet[str], window: int) -> int:
+    """Index of the closest of words among the window tokens before pos, or -1."""
+    i = pos - 1
+    stop = max(0, pos - window)
+    while i >= stop:
+        if tokens[i].value_lower in words:
+            return i
+        i -= 1
+    return -1
+
+
+# Kept as one loop: it runs for every token skipped before every statement,
+# and each special case reads the loop's locals
+def skip_narrative(tokens: List[Token], pos: int) -> int:  # noqa: PLR0912, PLR0915
+    """Return the position of the first token at or after pos that isn't narrative.
+
+    tokens must be padded like Parser.tokens: one sentinel before the real
+    tokens and two EOF sentinels after them, so no access needs a bounds check.
+    """
+    # Fast path for a clean statement boundary: a statement starter keyword
+    # (other than "while", as in "a while loop"), a paragraph break or EOF
+    first = tokens[pos]
+    kw_id = first.kw_id
+    if kw_id >= 0:
+        if _KW_FLAGS[kw_id] & _STARTER and kw_id != _KW_WHILE:
+            return pos
+    elif first.type is TokenType.PARAGRAPH_BREAK or first.type is TokenType.EOF:
+        return pos
+
+    skipped_any = False
+    kw_type = TokenType.KEYWORD
+    ident_type = TokenType.IDENTIFIER
+    punct_type = TokenType.PUNCTUATION
+    word_types = (ident_type, kw_type)
+
+    while True:
+        token = tokens[pos]
+        word = token.value_lower
+        kw_id = token.kw_id
+        kw_flags = _KW_FLAGS[kw_id] if kw_id >= 0 else 0
+
+        # Special case: "a" can be narrative (like "a counter", "a while loop")
+        # Check this BEFORE checking statement starters, so we can skip "a" even if followed by statement starters
+        if kw_id == _KW_A:
+            peek = tokens[pos + 1]
+            # If "a" is followed by narrative words, identifiers, or keywords (as in
+            # "a while loop"), it's probably narrative; "a variable" is a statement pattern
+            if peek.type in word_types:
+                if peek.value_lower not in _DECLARATION_WORDS:
+                    pos += 1
+                    skipped_any = True
+                    continue
+                # Even then, "a" preceded by narrative words (like "from", "to",
+                # "with", etc.) is narrative; only look back in this case
+                prev_token = tokens[pos - 1]
+                prev_word = prev_token.value_lower
+                if prev_word in _NARRATIVE_PRECEDERS or (
+                    prev_token.type in word_types and prev_word in _BASE_NARRATIVE_WORDS
+                ):
+                    pos += 1
+                    skipped_any = True
+                    continue
+
+        # If we hit a statement starter exactly, stop skipping
+        # But "while" can be narrative (like "use a while loop"), so check context
+        if kw_flags & _STARTER:
+            # Special case: "while" in "a while loop" is narrative
+            if kw_id == _KW_WHILE:
+                peek = tokens[pos + 1]
+                # If "while" is followed by "loop" (identifier), it's narrative
+                if peek.type is ident_type and peek.value_lower == "loop":
+                    pos += 1
+                    skipped_any = True
+                    continue
+            break
+        if token.type is ident_type and word in _STATEMENT_STARTERS:
+            break
+
+        # If we hit a statement keyword (like "variable"), stop skipping
+        # Exception: "it" can be narrative (like "add it to") or part of a statement (like "set it to")
+        # Only stop skipping "it" if it's followed by "to" and preceded by "set"
+        if kw_flags & _STATEMENT_KEYWORD:
+            if kw_id == _KW_IT:
+                # Check if "it" is part of "set it to" pattern
+                peek = tokens[pos + 1]
+                if peek.value_lower == "to":
+                    # Check if "set" appears recently before "it"
+                    is_set_it_to = _recent_index(tokens, pos, _SET_WORDS, 5) >= 0
+                    if is_set_it_to:
+                        break
+                    pos += 1
+                    skipped_any = True
+                    continue
+            else:
+                break
+
+        # Check if "each" is part of "for each" (statement) vs narrative (like "of each number")
+        if kw_id == _KW_EACH:
+            if tokens[pos - 1].value_lower == "for":
+                break
+            pos += 1
+            skipped_any = True
+            continue
+
+        # Check if this might be an identifier starting an assignment (x becomes, x equals, etc.)
+        if token.type is ident_type:
+            peek = tokens[pos + 1]
+            if peek.value_lower in _ASSIGN_OPS:
+                break
+            # Only break for "is now" pattern (assignment), not just "is" (which could be comparison)
+            if peek.value_lower == "is":
+                peek2 = tokens[pos + 2]
+                if peek2.value_lower == "now":
+                    break
+
+        # Skip narrative words and punctuation
+        # Also skip "to" if it's part of narrative (like "want to", "need to")
+        # But don't skip "now" if it's part of "is now" assignment pattern
+        # Don't skip "and" if it's part of "and set it to" pattern
+        is_now_in_assignment = False
+        if kw_id == _KW_NOW:
+            # "now" belongs to an "is now" assignment when an "is" is among the
+            # previous three words with no statement starter after it
+            is_index = _recent_index(tokens, pos, _IS_WORDS, 3)
+            if is_index >= 0:
+                is_now_in_assignment = (
+                    _recent_index(tokens, pos, _STATEMENT_STARTERS, pos - is_index - 1) < 0
+                )
+
+        is_and_in_statement = False
+        if kw_id == _KW_AND:
+            peek = tokens[pos + 1]
+            if peek.value_lower == "set":
+                is_and_in_statement = True
+
+        is_do_in_loop = kw_id == _KW_DO and _recent_index(tokens, pos, _LOOP_WORDS, 5) >= 0
+
+        if kw_id >= 0:
+            is_narrative = kw_flags & _NARRATIVE != 0
+        else:
+            is_narrative = token.type in word_types and is_narrative_word(word)
+
+        if (
+            (
+                is_narrative
+                and not is_now_in_assignment
+                and not is_and_in_statement
+                and not is_do_in_loop
+            )
+            or (kw_id == _KW_TO and skipped_any)
+            or (token.type is punct_type and token.value in _SKIPPED_PUNCTUATION)
+        ):
+            pos += 1
+            skipped_any = True
+        elif skipped_any and token.type is ident_type:
+            peek = tokens[pos + 1]
+            if peek.value_lower in _ASSIGN_OPS_WITH_IS:
+                break
+            pos += 1
+            skipped_any = True
+        else:
+            if not skipped_any:
+                break
+            break
+
+    return pos
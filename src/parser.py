@@ -1,6 +1,23 @@
-"""Parser for natural language constructs."""
-
-from typing import List, Optional
+"""Parser for natural language constructs.
+
+Hand-written recursive descent rather than a generated (e.g. LALR) parser:
+statements sit between free narrative text that is skipped by context, the
+same word can be a keyword, an identifier or narrative depending on its
+neighbours, and errors name the exact phrase that was expected.
+"""
+
+import sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NoReturn,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from src.ast import (
     Assignment,
@@ -18,18 +35,215 @@ from src.ast import (
     WhileLoop,
 )
 from src.lexer import Token, TokenType
+from src.narrative import skip_narrative
+
+# Statement verbs mapped to the keyword sequence that starts the statement and
+# the method that parses it; filled in after the Parser class.
+_STATEMENT_DISPATCH: Dict[str, Tuple[Tuple[str, ...], Callable[[Any], Optional[Statement]]]] = {}
+
+# Verbs whose inflected forms ("repeating") also start their statement
+_VERB_FORM_STEMS = ("create", "declare", "for", "while", "repeat")
+
+# Words accepted by skip_optional_any, lowercased
+_ARTICLES = frozenset({"a", "an"})
+_ASSIGNMENT_VERBS = frozenset({"equals", "becomes", "become"})
+
+# Words after an identifier that start an assignment
+_ASSIGNMENT_OPS = _ASSIGNMENT_VERBS | {"="}
+
+# Statement keywords that end an expression, or may not start one
+_EXPRESSION_STOP_WORDS = frozenset(
+    {"create", "declare", "set", "for", "while", "repeat", "if", "then", "else", "each"}
+)
+
+# Words after "and" that start a new clause instead of a logical operand
+_NARRATIVE_AFTER_AND = frozenset(
+    {
+        "finally",
+        "then",
+        "next",
+        "also",
+        "so",
+        "let",
+        "us",
+        "we",
+        "create",
+        "declare",
+        "set",
+        "for",
+        "while",
+        "repeat",
+        "each",
+    }
+)
+
+# Bits for the word after "and"/"or": it starts a new clause after "and", or
+# it ends an expression when it is a keyword or identifier
+_CLAUSE_WORD = 1
+_STOP_WORD = 2
+_WORD_BITS: Dict[str, int] = {
+    word: (_CLAUSE_WORD if word in _NARRATIVE_AFTER_AND else 0)
+    | (_STOP_WORD if word in _EXPRESSION_STOP_WORDS else 0)
+    for word in _NARRATIVE_AFTER_AND | _EXPRESSION_STOP_WORDS
+}
+
+# Binding strength of the binary operators; higher binds tighter
+_PREC_OR = 1
+_PREC_AND = 2
+_PREC_COMPARISON = 3
+_PREC_ADDITIVE = 4
+_PREC_MULTIPLICATIVE = 5
+
+# "and"/"or", matched by lowercased value: precedence, and the _WORD_BITS of a
+# following word that make it start a new clause instead of an operand
+_LOGICAL_OPS: Dict[str, Tuple[int, int]] = {
+    "or": (_PREC_OR, _STOP_WORD),
+    "and": (_PREC_AND, _CLAUSE_WORD | _STOP_WORD),
+}
+
+# What a keyword operator takes after it: nothing, an optional keyword, an
+# optional keyword or identifier, or a word that must be there
+_NO_WORD = 0
+_OPTIONAL_KEYWORD = 1
+_OPTIONAL_WORD = 2
+_REQUIRED_WORD = 3
+
+# Keyword operators: phrase -> (precedence, Python operator, what follows,
+# following word). A phrase is one or two keywords, as in "is greater";
+# the table is grouped by precedence and every comparison also takes "is".
+_BinopEntry = Tuple[int, str, int, str]
+_KEYWORD_BINOPS: Dict[str, _BinopEntry] = {
+    phrase: (precedence, op, follow, follow_word)
+    for precedence, operators in (
+        (
+            _PREC_COMPARISON,
+            (
+                ("greater", ">", _REQUIRED_WORD, "than"),
+                ("less", "<", _REQUIRED_WORD, "than"),
+                ("equal", "==", _OPTIONAL_KEYWORD, "to"),
+            ),
+        ),
+        (
+            _PREC_ADDITIVE,
+            (
+                ("add", "+", _OPTIONAL_KEYWORD, "to"),
+                ("plus", "+", _NO_WORD, ""),
+                ("subtract", "-", _OPTIONAL_KEYWORD, "from"),
+                ("minus", "-", _NO_WORD, ""),
+            ),
+        ),
+        (
+            _PREC_MULTIPLICATIVE,
+            (
+                ("multiply", "*", _OPTIONAL_WORD, "by"),
+                ("times", "*", _NO_WORD, ""),
+                ("divide", "/", _OPTIONAL_WORD, "by"),
+                ("divided", "/", _OPTIONAL_WORD, "by"),
+            ),
+        ),
+    )
+    for word, op, follow, follow_word in operators
+    for phrase in ((word, "is " + word) if precedence == _PREC_COMPARISON else (word,))
+}
+
+
+def _build_keyword_binop_trie() -> Dict[str, Tuple[Optional[_BinopEntry], Dict[str, _BinopEntry]]]:
+    """Index the keyword operator phrases by first word.
+
+    Each first word maps to its own entry (None when it is only a prefix, like
+    "is") and to the entries of the two-word phrases it starts.
+    """
+    trie: Dict[str, Tuple[Optional[_BinopEntry], Dict[str, _BinopEntry]]] = {}
+    for phrase, entry in _KEYWORD_BINOPS.items():
+        first, _, second = phrase.partition(" ")
+        own, continuations = trie.get(first, (None, {}))
+        if second:
+            continuations[second] = entry
+        else:
+            own = entry
+        trie[first] = (own, continuations)
+    return trie
+
+
+_KEYWORD_BINOP_TRIE = _build_keyword_binop_trie()
+
+# Symbolic operators: operator token -> (precedence, Python operator)
+_OPERATOR_BINOPS: Dict[str, Tuple[int, str]] = {
+    op: (precedence, op)
+    for precedence, ops in (
+        (_PREC_COMPARISON, ("==", "!=", "<=", ">=", "<", ">")),
+        (_PREC_ADDITIVE, ("+", "-")),
+        (_PREC_MULTIPLICATIVE, ("*", "/")),
+    )
+    for op in ops
+}
+
+# Keywords that parse_primary won't read as an identifier name
+_NON_IDENT_KEYWORDS = frozenset(
+    {
+        "true",
+        "false",
+        "and",
+        "or",
+        "not",
+        "in",
+        "is",
+        "do",
+        "to",
+        "from",
+        "by",
+        "than",
+        "equals",
+        "plus",
+        "minus",
+        "times",
+        "divided",
+        "becomes",
+        "called",
+        "create",
+        "now",
+    }
+)
+
+# Keywords compared by identity; keyword tokens carry interned lowercase values
+_IT = sys.intern("it")
+_NOT = sys.intern("not")
+_TRUE = sys.intern("true")
+
+# Shared literal nodes for booleans and small non-negative ints; nothing
+# mutates AST nodes after parsing, so one node can appear many times
+_TRUE_LITERAL = Literal(True)
+_FALSE_LITERAL = Literal(False)
+_SMALL_INT_LITERALS: Dict[int, Literal] = {value: Literal(value) for value in range(257)}
+
+# Padding around the token list, so lookbehind and lookahead never need a
+# bounds check and every scan stops at an EOF
+_SENTINEL = Token(TokenType.EOF, "", 0, 0)
 
 
 class Parser:
     """Parses tokens into an Abstract Syntax Tree."""
 
-    def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
-        self.pos = 0
+    __slots__ = ("_end", "_lowers", "_skip_from", "_skip_to", "_types", "pos", "tokens")
 
-    def error(self, message: str):
+    def __init__(self, tokens: List[Token]):
+        # One sentinel before the tokens and two after; _end is the index just
+        # past the real tokens
+        self.tokens = [_SENTINEL, *tokens, _SENTINEL, _SENTINEL]
+        self.pos = 1
+        self._end = len(tokens) + 1
+        # The padded tokens' types and lowercased values as parallel lists, for
+        # the hot loops that need only those two fields
+        self._types = [token.type for token in self.tokens]
+        self._lowers = [token.value_lower for token in self.tokens]
+        # Start and end of the last narrative skip; the tokens never change,
+        # so a skip from the same position always ends at the same place
+        self._skip_from = -1
+        self._skip_to = -1
+
+    def error(self, message: str) -> NoReturn:
         """Raise a parser error with position information."""
-        if self.pos < len(self.tokens):
+        if self.pos < self._end:
             token = self.tokens[self.pos]
             raise SyntaxError(
                 f"Parser error at line {token.line}, column {token.column}: {message}"
@@ -39,454 +253,92 @@ class Parser:
 
     def current_token(self) -> Optional[Token]:
         """Get the current token."""
-        if self.pos >= len(self.tokens):
+        if self.pos >= self._end:
             return None
         return self.tokens[self.pos]
 
     def peek_token(self, offset: int = 1) -> Optional[Token]:
         """Peek at a token ahead."""
         pos = self.pos + offset
-        if pos >= len(self.tokens):
+        if pos >= self._end:
             return None
         return self.tokens[pos]
 
-    def advance(self):
-        """Move to the next token."""
-        if self.pos < len(self.tokens):
+    def advance(self) -> None:
+        """Move to the next token.
+
+        Hot paths that have just read a real current token bump self.pos
+        directly instead; the sentinel padding keeps that in range.
+        """
+        if self.pos < self._end:
             self.pos += 1
 
-    def expect(self, token_type: TokenType, value: Optional[str] = None):
+    def expect(self, token_type: TokenType, value: Optional[str] = None) -> Token:
         """Expect a specific token type and optionally value."""
         token = self.current_token()
         if token is None or token.type != token_type:
             expected = f"{token_type.name}" + (f" with value {value!r}" if value else "")
             self.error(f"Expected {expected}, got {token.type.name if token else 'EOF'}")
-        if value is not None and token.value.lower() != value.lower():
+        if value is not None and token.value_lower != value.lower():
             self.error(f"Expected {value!r}, got {token.value!r}")
         self.advance()
         return token
 
-    def skip_optional(self, token_type: TokenType, value: Optional[str] = None):
+    def skip_optional(self, token_type: TokenType, value: Optional[str] = None) -> bool:
         """Skip a token if it matches, otherwise do nothing."""
         token = self.current_token()
         if token and token.type == token_type:
-            if value is None or token.value.lower() == value.lower():
-                self.advance()
+            if value is None or token.value_lower == value.lower():
+                self.pos += 1
                 return True
         return False
 
-    def skip_optional_keyword_or_identifier(self, value: str):
+    def skip_optional_any(self, token_type: TokenType, values: FrozenSet[str]) -> bool:
+        """Skip a token of the given type whose lowercased value is one of values."""
+        token = self.current_token()
+        if token and token.type is token_type and token.value_lower in values:
+            self.pos += 1
+            return True
+        return False
+
+    def skip_optional_keyword_or_identifier(self, value: str) -> bool:
         """Skip a token if it matches the value, whether it's a keyword or identifier."""
         token = self.current_token()
-        if token and token.value.lower() == value.lower():
+        if token and token.value_lower == value.lower():
             if token.type in (TokenType.KEYWORD, TokenType.IDENTIFIER):
-                self.advance()
+                self.pos += 1
                 return True
         return False
 
-    def skip_paragraph_breaks(self):
+    def skip_paragraph_breaks(self) -> None:
         """Skip paragraph break tokens."""
-        while self.current_token() and self.current_token().type == TokenType.PARAGRAPH_BREAK:
-            self.advance()
-
-    def skip_narrative_words(self):
+        types = self._types
+        pos = self.pos
+        break_type = TokenType.PARAGRAPH_BREAK
+        while types[pos] is break_type:
+            pos += 1
+        self.pos = pos
+
+    def skip_narrative_words(self) -> None:
         """Skip common narrative/introductory words that don't affect meaning."""
-        # Keywords that start actual statements
-        statement_starters = {"declare", "create", "set", "for", "while", "repeat", "if", "else"}
-        # Keywords that are part of statements (should not be skipped)
-        # Note: "now", "to", "is", "and", and "each" are not included here because they can be narrative (handled separately)
-        statement_keywords = {
-            "variable",
-            "named",
-            "called",
-            "as",
-            "it",
-            "or",
-            "not",
-            "in",
-            "do",
-            "true",
-            "false",
-            "times",
-            "equals",
-            "becomes",
-            "become",
-            "plus",
-            "minus",
-            "divided",
-            "greater",
-            "than",
-            "less",
-            "equal",
-        }
-
-        base_narrative_words = {
-            "let",
-            "me",
-            "start",
-            "by",
-            "now",
-            "first",
-            "then",
-            "next",
-            "also",
-            "we",
-            "want",
-            "need",
-            "will",
-            "can",
-            "should",
-            "shall",
-            "must",
-            "after",
-            "before",
-            "during",
-            "finally",
-            "later",
-            "on",
-            "once",
-            "this",
-            "that",
-            "these",
-            "those",
-            "so",
-            "which",
-            "who",
-            "what",
-            "when",
-            "where",
-            "why",
-            "how",
-            "whether",
-            "some",
-            "any",
-            "every",
-            "all",
-            "both",
-            "either",
-            "neither",
-            "another",
-            "other",
-            "such",
-            "same",
-            "different",
-            "new",
-            "old",
-            "last",
-            "be",
-            "our",
-            "their",
-            "my",
-            "your",
-            "his",
-            "her",
-            "its",
-            "us",
-            "them",
-            "they",
-            "he",
-            "she",
-            "it",
-            "i",
-            "make",
-            "makes",
-            "made",
-            "point",
-            "way",
-            "thing",
-            "things",
-            "one",
-            "ones",
-            "here",
-            "there",
-            "up",
-            "down",
-            "out",
-            "in",
-            "off",
-            "over",
-            "under",
-            "through",
-            "the",
-            "track",
-            "something",
-            "active",
-            "greet",
-            "user",
-            "properly",
-            "update",
-            "and",
-            "list",
-            "contains",
-            "numbers",
-            "work",
-            "with",
-            "do",
-            "of",
-            "each",
-            "calculate",
-            "square",
-            "adding",
-            "result",
-            "processing",
-            "set",
-            "counter",
-            "increment",
-            "time",
-            "loop",
-            "specific",
-            "times",
-            "iteration",
-            "change",
-            "demonstrates",
-            "assignment",
-            "number",
-            "variable",
-            "called",
-            "perform",
-            "calculations",
-            "multiply",
-            "together",
-            "subtraction",
-            "division",
-            "compare",
-            "values",
-            "larger",
-            "similarly",
-            "check",
-            "equality",
-            "combine",
-            "operations",
-            "logical",
-            "met",
-            "build",
-            "program",
-            "calculates",
-            "statistics",
-            "from",
-            "hold",
-            "running",
-            "sum",
-            "iterate",
-            "accumulate",
-            "added",
-            "add",
-            "average",
-            "mean",
-            "value",
-            "task",
-            "count",
-            "conditions",
-            "reached",
-            "threshold",
-            "transformation",
-            "use",
-        }
-
-        def is_narrative_word(word):
-            """Check if a word is a narrative word, including verb forms."""
-            word_lower = word.lower()
-            if word_lower in base_narrative_words:
-                return True
-            # Don't skip exact statement starters - they're needed for matching
-            if word_lower in statement_starters:
-                return False
-            # Check verb forms of narrative words (but not statement starters)
-            for base in base_narrative_words:
-                if word_lower.startswith(base) and len(word_lower) > len(base):
-                    return True
-            return False
-
-        skipped_any = False
-
-        while self.current_token():
-            token = self.current_token()
-            word = token.value.lower() if token.value else ""
-
-            # Special case: "a" can be narrative (like "a counter", "a while loop")
-            # Check this BEFORE checking statement starters, so we can skip "a" even if followed by statement starters
-            if token.type == TokenType.KEYWORD and word == "a":
-                peek = self.peek_token()
-                # Check if "a" is preceded by narrative words (like "from", "to", "with", etc.)
-                # If so, it's likely narrative even if followed by type keywords
-                is_preceded_by_narrative = False
-                if self.pos > 0:
-                    prev_token = self.tokens[self.pos - 1]
-                    if prev_token:
-                        prev_word = prev_token.value.lower() if prev_token.value else ""
-                        narrative_preceders = {
-                            "from",
-                            "to",
-                            "with",
-                            "in",
-                            "on",
-                            "at",
-                            "for",
-                            "of",
-                            "by",
-                            "about",
-                            "into",
-                            "onto",
-                            "upon",
-                        }
-                        if prev_word in narrative_preceders or (
-                            prev_token.type in (TokenType.IDENTIFIER, TokenType.KEYWORD)
-                            and prev_word in base_narrative_words
-                        ):
-                            is_preceded_by_narrative = True
-
-                # If "a" is followed by narrative words, identifiers, or certain keywords, it's probably narrative
-                if peek:
-                    # Check if it's a known statement pattern like "a variable"
-                    if peek.type == TokenType.IDENTIFIER:
-                        if (
-                            peek.value.lower()
-                            not in ("variable", "list", "string", "integer", "number", "boolean")
-                            or is_preceded_by_narrative
-                        ):
-                            self.advance()
-                            skipped_any = True
-                            continue
-                    elif peek.type == TokenType.KEYWORD:
-                        # "a" followed by keywords like "while" (in "a while loop") is narrative
-                        # But "a variable" is a statement pattern, so check for that
-                        # However, if preceded by narrative words, skip it anyway
-                        if (
-                            peek.value.lower()
-                            not in ("variable", "list", "string", "integer", "number", "boolean")
-                            or is_preceded_by_narrative
-                        ):
-                            self.advance()
-                            skipped_any = True
-                            continue
-
-            # If we hit a statement starter exactly, stop skipping
-            # But "while" can be narrative (like "use a while loop"), so check context
-            if token.type == TokenType.KEYWORD and word in statement_starters:
-                # Special case: "while" in "a while loop" is narrative
-                if word == "while":
-                    peek = self.peek_token()
-                    # If "while" is followed by "loop" (identifier), it's narrative
-                    if peek and peek.type == TokenType.IDENTIFIER and peek.value.lower() == "loop":
-                        self.advance()
-                        skipped_any = True
-                        continue
-                break
-            if token.type == TokenType.IDENTIFIER and word in statement_starters:
-                break
-
-            # If we hit a statement keyword (like "variable"), stop skipping
-            # Exception: "it" can be narrative (like "add it to") or part of a statement (like "set it to")
-            # Only stop skipping "it" if it's followed by "to" and preceded by "set"
-            if token.type == TokenType.KEYWORD and word in statement_keywords:
-                if word == "it":
-                    # Check if "it" is part of "set it to" pattern
-                    peek = self.peek_token()
-                    if peek and peek.value.lower() == "to":
-                        # Check if "set" appears recently before "it"
-                        is_set_it_to = False
-                        for i in range(max(0, self.pos - 5), self.pos):
-                            if i < len(self.tokens) and self.tokens[i].value.lower() == "set":
-                                is_set_it_to = True
-                                break
-                        if is_set_it_to:
-                            break
-                        self.advance()
-                        skipped_any = True
-                        continue
-                else:
-                    break
-
-            # Check if "each" is part of "for each" (statement) vs narrative (like "of each number")
-            if token.type == TokenType.KEYWORD and word == "each":
-                if self.pos > 0:
-                    prev_token = self.tokens[self.pos - 1]
-                    if prev_token and prev_token.value.lower() == "for":
-                        break
-                self.advance()
-                skipped_any = True
-                continue
-
-            # Check if this might be an identifier starting an assignment (x becomes, x equals, etc.)
-            if token.type == TokenType.IDENTIFIER:
-                peek = self.peek_token()
-                if peek and peek.value.lower() in ("equals", "=", "becomes", "become"):
-                    break
-                # Only break for "is now" pattern (assignment), not just "is" (which could be comparison)
-                if peek and peek.value.lower() == "is":
-                    peek2 = self.peek_token(2)
-                    if peek2 and peek2.value.lower() == "now":
-                        break
-
-            # Skip narrative words and punctuation
-            # Also skip "to" if it's part of narrative (like "want to", "need to")
-            # But don't skip "now" if it's part of "is now" assignment pattern
-            # Don't skip "and" if it's part of "and set it to" pattern
-            is_now_in_assignment = False
-            if word == "now":
-                if self.pos > 0:
-                    prev_token = self.tokens[self.pos - 1]
-                    if prev_token and prev_token.value.lower() == "is":
-                        is_now_in_assignment = True
-                    for i in range(max(0, self.pos - 3), self.pos):
-                        if i < len(self.tokens) and self.tokens[i].value.lower() == "is":
-                            has_keyword_between = False
-                            for j in range(i + 1, self.pos):
-                                if j < len(self.tokens):
-                                    tok_val = self.tokens[j].value.lower()
-                                    if tok_val in statement_starters:
-                                        has_keyword_between = True
-                                        break
-                            if not has_keyword_between:
-                                is_now_in_assignment = True
-                                break
-
-            is_and_in_statement = False
-            if word == "and":
-                peek = self.peek_token()
-                if peek and peek.value.lower() == "set":
-                    is_and_in_statement = True
-
-            is_do_in_loop = False
-            if word == "do":
-                for i in range(max(0, self.pos - 5), self.pos):
-                    if i < len(self.tokens):
-                        tok_val = self.tokens[i].value.lower()
-                        if tok_val in ("for", "while", "repeat", "each"):
-                            is_do_in_loop = True
-                            break
-
-            if (
-                (
-                    token.type in (TokenType.IDENTIFIER, TokenType.KEYWORD)
-                    and is_narrative_word(word)
-                    and not is_now_in_assignment
-                    and not is_and_in_statement
-                    and not is_do_in_loop
-                )
-                or (token.type == TokenType.KEYWORD and word == "to" and skipped_any)
-                or (token.type == TokenType.PUNCTUATION and token.value in (",", ".", ";", ":"))
-            ):
-                self.advance()
-                skipped_any = True
-            elif skipped_any and token.type == TokenType.IDENTIFIER:
-                peek = self.peek_token()
-                if peek and peek.value.lower() in ("equals", "=", "becomes", "become", "is"):
-                    break
-                self.advance()
-                skipped_any = True
-            else:
-                if not skipped_any:
-                    break
-                break
+        pos = self.pos
+        if pos in (self._skip_from, self._skip_to):
+            # Same start as last time, or where the last skip stopped (which
+            # skip_narrative would not move past again)
+            self.pos = self._skip_to
+            return
+        self._skip_from = pos
+        self.pos = self._skip_to = skip_narrative(self.tokens, pos)
 
     def parse(self) -> Program:
         """Parse the tokens into a Program AST node."""
-        statements = []
+        statements: List[Statement] = []
+        types = self._types
+        eof_type = TokenType.EOF
 
-        while self.current_token() and self.current_token().type != TokenType.EOF:
+        while types[self.pos] is not eof_type:
             self.skip_paragraph_breaks()
-            if self.current_token() and self.current_token().type != TokenType.EOF:
+            if types[self.pos] is not eof_type:
                 stmt = self.parse_statement()
                 if stmt:
                     statements.append(stmt)
@@ -495,105 +347,80 @@ class Parser:
 
     def parse_statement(self) -> Optional[Statement]:
         """Parse a statement."""
-        self.skip_paragraph_breaks()
-        self.skip_narrative_words()
+        # The lookaheads below read the padded lists directly: past the end
+        # they see sentinels, whose empty value matches no word
+        types = self._types
+        lowers = self._lowers
 
-        token = self.current_token()
-        if token and token.value.lower() == "set":
-            peek = self.peek_token()
-            if peek and peek.value.lower() == "up":
-                self.advance()
-                self.advance()
-                token_after_up = self.current_token()
-                if token_after_up and token_after_up.value.lower() == "a":
-                    self.advance()
-                    token_after_a = self.current_token()
-                    if token_after_a and token_after_a.type == TokenType.IDENTIFIER:
-                        self.advance()
-                self.skip_narrative_words()
-                return self.parse_statement()
+        # Each pass consumes one "set up a X" preamble; loop rather than recurse
+        # so chained preambles don't grow the stack
+        while True:
+            self.skip_paragraph_breaks()
+            self.skip_narrative_words()
+
+            pos = self.pos
+            if lowers[pos] != "set" or lowers[pos + 1] != "up":
+                break
+            pos += 2
+            if lowers[pos] == "a":
+                pos += 1
+                if types[pos] is TokenType.IDENTIFIER:
+                    pos += 1
+            self.pos = pos
+            self.skip_narrative_words()
 
         token = self.current_token()
 
         if not token or token.type in (TokenType.EOF, TokenType.PARAGRAPH_BREAK):
             return None
 
-        token_value = token.value.lower() if token.value else ""
-        saved_pos = self.pos
-
-        if token_value.startswith("declare"):
-            if token_value != "declare":
-                self.advance()
-            if self.match_keyword_sequence(["a", "variable", "named"]):
-                self.pos = saved_pos
-                if self.match_keyword_sequence(["declare", "a", "variable", "named"]):
-                    return self.parse_variable_declaration()
-                self.pos = saved_pos
-
-        if token_value.startswith("create"):
-            return self.parse_variable_declaration()
-
-        if self.match_keyword_sequence(["declare", "a", "variable", "named"]):
-            return self.parse_variable_declaration()
+        verb = token.value_lower
+        entry = _STATEMENT_DISPATCH.get(verb)
+        if entry is None:
+            for stem in _VERB_FORM_STEMS:
+                if verb.startswith(stem):
+                    entry = _STATEMENT_DISPATCH[stem]
+                    break
+        if entry is not None and self.match_keyword_sequence(entry[0]):
+            return entry[1](self)
 
-        if token.value.lower() == "set":
-            if self.match_keyword_sequence(["set"]):
+        if token.type == TokenType.IDENTIFIER:
+            peek_word = lowers[self.pos + 1]
+            if peek_word in _ASSIGNMENT_OPS or (
+                peek_word == "is" and lowers[self.pos + 2] == "now"
+            ):
                 return self.parse_assignment()
 
-        if self.match_keyword_sequence(["for", "each"]):
-            return self.parse_for_loop()
-
-        if self.match_keyword_sequence(["while"]):
-            return self.parse_while_loop()
-
-        if self.match_keyword_sequence(["repeat"]):
-            return self.parse_repeat_loop()
-
-        if token.type == TokenType.IDENTIFIER:
-            peek = self.peek_token()
-            if peek:
-                if peek.value.lower() in ("equals", "=", "becomes", "become"):
-                    return self.parse_assignment()
-                elif peek.value.lower() == "is":
-                    peek2 = self.peek_token(2)
-                    if peek2 and peek2.value.lower() == "now":
-                        return self.parse_assignment()
-
-        if token:
-            self.advance()
+        self.pos += 1
         return None
 
-    def match_keyword_sequence(self, keywords: List[str]) -> bool:
-        """Check if the next tokens match a sequence of keywords, handling verb forms."""
-        saved_pos = self.pos
+    def match_keyword_sequence(self, keywords: Sequence[str]) -> bool:
+        """Check if the next tokens match a sequence of lowercased keywords, handling verb forms.
+
+        A pure lookahead: the position is left where it was.
+        """
+        tokens = self.tokens
+        pos = self.pos
+        end = self._end
+        kw_type = TokenType.KEYWORD
+        ident_type = TokenType.IDENTIFIER
 
         for i, keyword in enumerate(keywords):
-            token = self.current_token()
-            if not token:
-                self.pos = saved_pos
+            if pos >= end:
                 return False
+            token = tokens[pos]
+            token_value = token.value_lower
 
-            token_value = token.value.lower() if token.value else ""
-            keyword_lower = keyword.lower()
-
-            if (
-                token.type == TokenType.KEYWORD or token.type == TokenType.IDENTIFIER
-            ) and token_value == keyword_lower:
-                self.advance()
+            if (token.type is kw_type or token.type is ident_type) and token_value == keyword:
+                pos += 1
                 continue
 
-            if (
-                i == 0
-                and token_value.startswith(keyword_lower)
-                and len(token_value) > len(keyword_lower)
-            ):
-                self.advance()
+            if i == 0 and token_value.startswith(keyword) and len(token_value) > len(keyword):
+                pos += 1
                 continue
 
-            self.pos = saved_pos
             return False
 
-        self.pos = saved_pos
         return True
 
     def parse_variable_declaration(self) -> VariableDeclaration:
@@ -603,17 +430,19 @@ class Parser:
         token = self.current_token()
         if not token:
             self.error("Unexpected end of input in variable declaration")
-        token_value = token.value.lower() if token.value else ""
+        token_value = token.value_lower
 
         if token_value == "a":
-            peek = self.peek_token(1)
-            if peek and peek.value.lower() == "variable":
-                peek2 = self.peek_token(2)
-                if peek2 and peek2.value.lower() == "named":
+            # Both lookahead words read at once; sentinels pad the end
+            lowers = self._lowers
+            peek_word = lowers[self.pos + 1]
+            peek2_word = lowers[self.pos + 2]
+            if peek_word == "variable":
+                if peek2_word == "named":
                     self.skip_optional(TokenType.KEYWORD, "a")
                     self.expect(TokenType.KEYWORD, "variable")
                     self.expect(TokenType.KEYWORD, "named")
-                elif peek2 and peek2.value.lower() == "called":
+                elif peek2_word == "called":
                     self.skip_optional(TokenType.KEYWORD, "a")
                     self.expect(TokenType.KEYWORD, "variable")
                     self.expect(TokenType.KEYWORD, "called")
@@ -645,7 +474,7 @@ class Parser:
         else:
             self.error("Expected 'declare' or 'create' for variable declaration")
 
-        token = self.current_token()
+        token = self.tokens[self.pos]
         if token.type == TokenType.IDENTIFIER:
             name_token = self.expect(TokenType.IDENTIFIER)
             name = name_token.value
@@ -654,12 +483,10 @@ class Parser:
             name = name_token.value
         else:
             self.error(f"Expected identifier for variable name, got {token.type.name}")
-            name = ""
 
-        var_type = None
+        var_type: Optional[str] = None
         if self.skip_optional(TokenType.KEYWORD, "as"):
-            self.skip_optional(TokenType.KEYWORD, "a")
-            self.skip_optional(TokenType.KEYWORD, "an")
+            self.skip_optional_any(TokenType.KEYWORD, _ARTICLES)
             type_token = self.expect(TokenType.KEYWORD)
             var_type = type_token.value
 
@@ -676,14 +503,14 @@ class Parser:
 
     def parse_assignment(self) -> Assignment:
         """Parse: set X to Y or X equals Y or X becomes Y or X is now Y"""
-        token = self.current_token()
+        token = self.tokens[self.pos]
 
-        if token.value.lower() == "set":
+        if token.value_lower == "set":
             self.expect(TokenType.KEYWORD, "set")
             name_token = self.current_token()
             if name_token and (
                 name_token.type == TokenType.IDENTIFIER
-                or (name_token.type == TokenType.KEYWORD and name_token.value.lower() == "it")
+                or (name_token.type == TokenType.KEYWORD and name_token.value_lower is _IT)
             ):
                 self.advance()
             else:
@@ -695,11 +522,8 @@ class Parser:
             return Assignment(name_token.value, value)
         else:
             name_token = self.expect(TokenType.IDENTIFIER)
-            if (
-                self.skip_optional(TokenType.KEYWORD, "equals")
-                or self.skip_optional(TokenType.OPERATOR, "=")
-                or self.skip_optional(TokenType.KEYWORD, "becomes")
-                or self.skip_optional(TokenType.KEYWORD, "become")
+            if self.skip_optional_any(TokenType.KEYWORD, _ASSIGNMENT_VERBS) or self.skip_optional(
+                TokenType.OPERATOR, "="
             ):
                 value = self.parse_expression()
                 return Assignment(name_token.value, value)
@@ -719,7 +543,7 @@ class Parser:
         self.expect(TokenType.KEYWORD, "for")
         self.expect(TokenType.KEYWORD, "each")
 
-        token = self.current_token()
+        token = self.tokens[self.pos]
         if token.type == TokenType.IDENTIFIER:
             item_token = self.expect(TokenType.IDENTIFIER)
             item_var = item_token.value
@@ -728,7 +552,6 @@ class Parser:
             item_var = item_token.value
         else:
             self.error(f"Expected identifier for loop variable, got {token.type.name}")
-            item_var = ""
 
         self.expect(TokenType.KEYWORD, "in")
 
@@ -750,17 +573,13 @@ class Parser:
 
         condition = self.parse_expression()
 
-        if (
-            self.current_token()
-            and self.current_token().type == TokenType.KEYWORD
-            and self.current_token().value.lower() == "is"
-        ):
+        # An optional "is true"; the sentinel padding makes these reads safe
+        tokens = self.tokens
+        token = tokens[self.pos]
+        if token.type == TokenType.KEYWORD and token.value_lower == "is":
             self.advance()
-            if (
-                self.current_token()
-                and self.current_token().type == TokenType.KEYWORD
-                and self.current_token().value.lower() == "true"
-            ):
+            token = tokens[self.pos]
+            if token.type == TokenType.KEYWORD and token.value_lower == "true":
                 self.advance()
 
         self.skip_optional(TokenType.PUNCTUATION, ",")
@@ -793,13 +612,16 @@ class Parser:
 
     def parse_block(self) -> List[Statement]:
         """Parse a block of statements."""
-        body = []
+        body: List[Statement] = []
 
         self.skip_paragraph_breaks()
+        types = self._types
+        eof_type = TokenType.EOF
+        break_type = TokenType.PARAGRAPH_BREAK
 
         while True:
-            token = self.current_token()
-            if not token or token.type == TokenType.EOF or token.type == TokenType.PARAGRAPH_BREAK:
+            token_type = types[self.pos]
+            if token_type is eof_type or token_type is break_type:
                 break
 
             saved_pos = self.pos
@@ -816,283 +638,128 @@ class Parser:
     def parse_expression(self) -> Expression:
         """Parse an expression."""
         token = self.current_token()
-        if token:
-            statement_keywords = {
-                "create",
-                "declare",
-                "set",
-                "for",
-                "while",
-                "repeat",
-                "if",
-                "then",
-                "else",
-                "each",
-            }
-            if (token.type == TokenType.KEYWORD and token.value.lower() in statement_keywords) or (
-                token.type == TokenType.IDENTIFIER and token.value.lower() in statement_keywords
-            ):
-                self.error(f"Unexpected statement keyword '{token.value}' - expression expected")
-        return self.parse_logical_or()
-
-    def parse_logical_or(self) -> Expression:
-        """Parse logical OR expression."""
-        left = self.parse_logical_and()
-
-        statement_keywords = {
-            "create",
-            "declare",
-            "set",
-            "for",
-            "while",
-            "repeat",
-            "if",
-            "then",
-            "else",
-            "each",
-        }
-
-        while self.current_token() and self.current_token().value.lower() == "or":
-            peek = self.peek_token()
-            if peek and (
-                (peek.type == TokenType.KEYWORD and peek.value.lower() in statement_keywords)
-                or (peek.type == TokenType.IDENTIFIER and peek.value.lower() in statement_keywords)
-            ):
-                break
-            op_token = self.expect(TokenType.KEYWORD, "or")
-            right = self.parse_logical_and()
-            left = BinaryOp(left, "or", right)
-
-        return left
-
-    def parse_logical_and(self) -> Expression:
-        """Parse logical AND expression."""
-        left = self.parse_comparison()
-
-        statement_keywords = {
-            "create",
-            "declare",
-            "set",
-            "for",
-            "while",
-            "repeat",
-            "if",
-            "then",
-            "else",
-            "each",
-        }
-        narrative_after_and = {
-            "finally",
-            "then",
-            "next",
-            "also",
-            "so",
-            "let",
-            "us",
-            "we",
-            "create",
-            "declare",
-            "set",
-            "for",
-            "while",
-            "repeat",
-            "each",
-        }
-
-        while self.current_token() and self.current_token().value.lower() == "and":
-            peek = self.peek_token()
-            if peek and (
-                peek.value.lower() in narrative_after_and
-                or (peek.type == TokenType.KEYWORD and peek.value.lower() in statement_keywords)
-                or (peek.type == TokenType.IDENTIFIER and peek.value.lower() in statement_keywords)
-            ):
-                break
-            op_token = self.expect(TokenType.KEYWORD, "and")
-            right = self.parse_comparison()
-            left = BinaryOp(left, "and", right)
-
-        return left
-
-    def parse_comparison(self) -> Expression:
-        """Parse comparison expression."""
-        left = self.parse_additive()
-
-        while self.current_token():
-            token = self.current_token()
-
-            if token.type == TokenType.KEYWORD:
-                if token.value.lower() == "is":
-                    self.advance()
-                    token = self.current_token()
-                    if token and token.type == TokenType.KEYWORD:
-                        if token.value.lower() == "greater":
-                            self.advance()
-                            token = self.current_token()
-                            if token and token.value.lower() == "than":
-                                self.advance()
-                            else:
-                                self.error("Expected 'than' after 'is greater'")
-                            right = self.parse_additive()
-                            left = BinaryOp(left, ">", right)
-                            continue
-                        elif token.value.lower() == "less":
-                            self.advance()
-                            token = self.current_token()
-                            if token and token.value.lower() == "than":
-                                self.advance()
-                            else:
-                                self.error("Expected 'than' after 'is less'")
-                            right = self.parse_additive()
-                            left = BinaryOp(left, "<", right)
-                            continue
-                        elif token.value.lower() == "equal":
-                            self.advance()
-                            self.skip_optional(TokenType.KEYWORD, "to")
-                            right = self.parse_additive()
-                            left = BinaryOp(left, "==", right)
-                            continue
-                    # If 'is' is not followed by a comparison keyword, backtrack
-                    self.pos -= 1
+        if (
+            token
+            and token.value_lower in _EXPRESSION_STOP_WORDS
+            and token.type in (TokenType.KEYWORD, TokenType.IDENTIFIER)
+        ):
+            self.error(f"Unexpected statement keyword '{token.value}' - expression expected")
+        return self.parse_binary()
+
+    # One loop on purpose: it runs once per operator and operand, and the
+    # operator matching and reductions share its local position and stacks
+    def parse_binary(self) -> Expression:  # noqa: PLR0912, PLR0915
+        """Parse a chain of operands joined by binary operators.
+
+        Shunting-yard over the operator tables with explicit operand and
+        operator stacks: an operator first reduces every stacked operator
+        that binds at least as tightly, so every level is left-associative.
+        """
+        operands = [self.parse_unary()]
+        operators: List[Tuple[int, str]] = []
+        types = self._types
+        lowers = self._lowers
+        kw_type = TokenType.KEYWORD
+        ident_type = TokenType.IDENTIFIER
+
+        # Works on a local position, written back before parse_unary and errors
+        while True:
+            pos = self.pos
+            token_type = types[pos]
+            word = lowers[pos]
+
+            logical = _LOGICAL_OPS.get(word)
+            if logical is not None:
+                precedence, clause_bits = logical
+                # Don't swallow a following clause, as in "... and set it to ..."
+                peek_bits = _WORD_BITS.get(lowers[pos + 1], 0) & clause_bits
+                if peek_bits:
+                    # A clause word of any token type, or a stop word keyword
+                    if peek_bits & _CLAUSE_WORD:
+                        break
+                    peek_type = types[pos + 1]
+                    if peek_type is kw_type or peek_type is ident_type:
+                        break
+                if token_type is not kw_type:
+                    # A string like "or" in operator position
+                    self.expect(kw_type, word)
+                pos += 1
+                op = word
+            elif token_type is kw_type:
+                node = _KEYWORD_BINOP_TRIE.get(word)
+                if node is None:
                     break
-                elif token.value.lower() == "greater":
-                    self.advance()
-                    token = self.current_token()
-                    if token and token.value.lower() == "than":
-                        self.advance()
-                    else:
-                        self.error("Expected 'than' after 'greater'")
-                    right = self.parse_additive()
-                    left = BinaryOp(left, ">", right)
-                    continue
-                elif token.value.lower() == "less":
-                    self.advance()
-                    token = self.current_token()
-                    if token and token.value.lower() == "than":
-                        self.advance()
-                    else:
-                        self.error("Expected 'than' after 'less'")
-                    right = self.parse_additive()
-                    left = BinaryOp(left, "<", right)
-                    continue
-                elif token.value.lower() == "equal":
-                    self.advance()
-                    self.skip_optional(TokenType.KEYWORD, "to")
-                    right = self.parse_additive()
-                    left = BinaryOp(left, "==", right)
-                    continue
-
-            if token.type == TokenType.OPERATOR and token.value in (
-                "==",
-                "!=",
-                "<=",
-                ">=",
-                "<",
-                ">",
-            ):
-                op = token.value
-                self.advance()
-                right = self.parse_additive()
-                left = BinaryOp(left, op, right)
-                continue
-
-            break
-
-        return left
-
-    def parse_additive(self) -> Expression:
-        """Parse additive expression (+, -)."""
-        left = self.parse_multiplicative()
-
-        while self.current_token():
-            token = self.current_token()
-
-            if token.type == TokenType.KEYWORD:
-                if token.value.lower() == "add":
-                    self.advance()
-                    self.skip_optional(TokenType.KEYWORD, "to")
-                    right = self.parse_multiplicative()
-                    left = BinaryOp(left, "+", right)
-                    continue
-                elif token.value.lower() == "plus":
-                    self.advance()
-                    right = self.parse_multiplicative()
-                    left = BinaryOp(left, "+", right)
-                    continue
-                elif token.value.lower() == "subtract":
-                    self.advance()
-                    self.skip_optional(TokenType.KEYWORD, "from")
-                    right = self.parse_multiplicative()
-                    left = BinaryOp(left, "-", right)
-                    continue
-                elif token.value.lower() == "minus":
-                    self.advance()
-                    right = self.parse_multiplicative()
-                    left = BinaryOp(left, "-", right)
-                    continue
-
-            if token.type == TokenType.OPERATOR and token.value in ("+", "-"):
-                op = token.value
-                self.advance()
-                right = self.parse_multiplicative()
-                left = BinaryOp(left, op, right)
-                continue
-
-            break
-
-        return left
-
-    def parse_multiplicative(self) -> Expression:
-        """Parse multiplicative expression (*, /)."""
-        left = self.parse_unary()
-
-        while self.current_token():
-            token = self.current_token()
-
-            if token.type == TokenType.KEYWORD:
-                if token.value.lower() == "multiply":
-                    self.advance()
-                    self.skip_optional_keyword_or_identifier("by")
-                    right = self.parse_unary()
-                    left = BinaryOp(left, "*", right)
-                    continue
-                elif token.value.lower() == "times":
-                    self.advance()
-                    right = self.parse_unary()
-                    left = BinaryOp(left, "*", right)
-                    continue
-                elif token.value.lower() == "divide" or token.value.lower() == "divided":
-                    self.advance()
-                    self.skip_optional_keyword_or_identifier("by")
-                    right = self.parse_unary()
-                    left = BinaryOp(left, "/", right)
-                    continue
-
-            if token.type == TokenType.OPERATOR and token.value in ("*", "/"):
-                op = token.value
-                self.advance()
-                right = self.parse_unary()
-                left = BinaryOp(left, op, right)
-                continue
+                entry, continuations = node
+                length = 1
+                if continuations:
+                    # Longest match: prefer a two-word phrase like "is greater"
+                    peek_word = lowers[pos + 1]
+                    if types[pos + 1] is kw_type and peek_word in continuations:
+                        entry = continuations[peek_word]
+                        word += " " + peek_word
+                        length = 2
+                if entry is None:
+                    # A bare prefix such as "is" ends the expression unconsumed
+                    break
+                precedence, op, follow, follow_word = entry
+                pos += length
+                if follow == _REQUIRED_WORD:
+                    if lowers[pos] != follow_word:
+                        self.pos = pos
+                        self.error(f"Expected '{follow_word}' after '{word}'")
+                    pos += 1
+                elif follow:
+                    follow_type = types[pos]
+                    if lowers[pos] == follow_word and (
+                        follow_type is kw_type
+                        or (follow == _OPTIONAL_WORD and follow_type is ident_type)
+                    ):
+                        pos += 1
+            elif token_type is TokenType.OPERATOR:
+                # Operator values are their own lowercase form
+                symbol = _OPERATOR_BINOPS.get(word)
+                if symbol is None:
+                    break
+                precedence, op = symbol
+                pos += 1
+            else:
+                break
 
-            break
+            while operators and operators[-1][0] >= precedence:
+                _, top = operators.pop()
+                right = operands.pop()
+                operands[-1] = BinaryOp(operands[-1], top, right)
+            operators.append((precedence, op))
+            self.pos = pos
+            operands.append(self.parse_unary())
 
-        return left
+        while operators:
+            _, top = operators.pop()
+            right = operands.pop()
+            operands[-1] = BinaryOp(operands[-1], top, right)
+        return operands[0]
 
     def parse_unary(self) -> Expression:
-        """Parse unary expression."""
-        token = self.current_token()
-
-        if token and token.type == TokenType.KEYWORD and token.value.lower() == "not":
-            self.advance()
-            operand = self.parse_unary()
-            return UnaryOp("not", operand)
-
-        if token and token.type == TokenType.OPERATOR and token.value == "-":
-            self.advance()
-            operand = self.parse_unary()
-            return UnaryOp("-", operand)
+        """Parse unary expression: any run of prefix "not"/"-" before a primary."""
+        types = self._types
+        lowers = self._lowers
+        pos = self.pos
+        prefixes: List[str] = []
+        while True:
+            token_type = types[pos]
+            if token_type is TokenType.KEYWORD and lowers[pos] is _NOT:
+                prefixes.append("not")
+            elif token_type is TokenType.OPERATOR and lowers[pos] == "-":
+                prefixes.append("-")
+            else:
+                break
+            pos += 1
+        self.pos = pos
 
-        return self.parse_primary()
+        operand = self.parse_primary()
+        for op in reversed(prefixes):
+            operand = UnaryOp(op, operand)
+        return operand
 
     def parse_primary(self) -> Expression:
         """Parse primary expression (literals, identifiers, parenthesized)."""
@@ -1101,65 +768,32 @@ class Parser:
         if not token:
             self.error("Unexpected end of input")
 
-        statement_keywords = {
-            "create",
-            "declare",
-            "set",
-            "for",
-            "while",
-            "repeat",
-            "if",
-            "then",
-            "else",
-            "each",
-        }
-
-        if token.type == TokenType.KEYWORD and token.value.lower() in statement_keywords:
+        if token.type == TokenType.KEYWORD and token.value_lower in _EXPRESSION_STOP_WORDS:
             self.error(f"Unexpected statement keyword '{token.value}' in expression")
 
         if token.type == TokenType.NUMBER:
             self.advance()
-            value = float(token.value) if "." in token.value else int(token.value)
-            return Literal(value)
+            number = token.number
+            # Only an int may hit the cache: 1.0 == 1 but must stay a float
+            literal = _SMALL_INT_LITERALS.get(number) if type(number) is int else None
+            return literal if literal is not None else Literal(number)
 
         if token.type == TokenType.STRING:
             self.advance()
             return Literal(token.value)
 
-        if token.type == TokenType.KEYWORD and token.value.lower() in ("true", "false"):
+        if token.type == TokenType.KEYWORD and token.value_lower in ("true", "false"):
             self.advance()
-            return Literal(token.value.lower() == "true")
+            return _TRUE_LITERAL if token.value_lower is _TRUE else _FALSE_LITERAL
 
         if token.type == TokenType.IDENTIFIER:
-            if token.value.lower() in statement_keywords:
+            if token.value_lower in _EXPRESSION_STOP_WORDS:
                 self.error(f"Unexpected statement keyword '{token.value}' in expression")
             self.advance()
             return Identifier(token.value)
 
         if token.type == TokenType.KEYWORD:
-            if token.value.lower() not in (
-                "true",
-                "false",
-                "and",
-                "or",
-                "not",
-                "in",
-                "is",
-                "do",
-                "to",
-                "from",
-                "by",
-                "than",
-                "equals",
-                "plus",
-                "minus",
-                "times",
-                "divided",
-                "becomes",
-                "called",
-                "create",
-                "now",
-            ):
+            if token.value_lower not in _NON_IDENT_KEYWORDS:
                 self.advance()
                 return Identifier(token.value)
 
@@ -1167,29 +801,54 @@ class Parser:
             return self.parse_list_literal()
 
         if token.type == TokenType.PUNCTUATION and token.value == "(":
-            self.advance()
+            self.pos += 1
             expr = self.parse_expression()
-            self.expect(TokenType.PUNCTUATION, ")")
+            # Inline match of the closing ")"; expect() only builds the error
+            closing = self.tokens[self.pos]
+            if closing.type is TokenType.PUNCTUATION and closing.value == ")":
+                self.pos += 1
+            else:
+                self.expect(TokenType.PUNCTUATION, ")")
             return expr
 
         self.error(f"Unexpected token in expression: {token.value!r}")
 
     def parse_list_literal(self) -> Expression:
         """Parse a list literal: [expr1, expr2, ...]"""
-        self.expect(TokenType.PUNCTUATION, "[")
-
-        elements = []
+        tokens = self.tokens
+        token = tokens[self.pos]
+        if token.type is TokenType.PUNCTUATION and token.value == "[":
+            self.pos += 1
+        else:
+            self.expect(TokenType.PUNCTUATION, "[")
 
-        if self.current_token() and self.current_token().value == "]":
-            self.advance()
+        if tokens[self.pos].value == "]":
+            self.pos += 1
             return ListLiteral([])
 
-        elements.append(self.parse_expression())
-
-        while self.current_token() and self.current_token().value == ",":
-            self.advance()
-            elements.append(self.parse_expression())
+        elements = [self.parse_expression()]
+        append = elements.append
+        while tokens[self.pos].value == ",":
+            self.pos += 1
+            append(self.parse_expression())
 
-        self.expect(TokenType.PUNCTUATION, "]")
+        token = tokens[self.pos]
+        if token.type is TokenType.PUNCTUATION and token.value == "]":
+            self.pos += 1
+        else:
+            self.expect(TokenType.PUNCTUATION, "]")
 
         return ListLiteral(elements)
+
+
+_STATEMENT_DISPATCH.update(
+    {
+        # "create" and its verb forms always start a declaration
+        "create": ((), Parser.parse_variable_declaration),
+        "declare": (("declare", "a", "variable", "named"), Parser.parse_variable_declaration),
+        "set": (("set",), Parser.parse_assignment),
+        "for": (("for", "each"), Parser.parse_for_loop),
+        "while": (("while",), Parser.parse_while_loop),
+        "repeat": (("repeat",), Parser.parse_repeat_loop),
+    }
+)
@@ -0,0 +1,22 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+import pytest
+
+from src.compiler import Compiler
+
+
+@pytest.fixture(scope="session")
+def compile_cached() -> Callable[[str], str]:
+    """Compile a file at most once per session, keyed by path and mtime."""
+    cache: Dict[Tuple[str, int], str] = {}
+
+    def compile_file(file_path: str) -> str:
+        key = (file_path, Path(file_path).stat().st_mtime_ns)
+        if key not in cache:
+            cache[key] = Compiler().compile_file(file_path)
+        return cache[key]
+
+    return compile_file
@@ -0,0 +1,100 @@
+"""Tests for the command-line interface."""
+
+import sys
+
+import pytest
+
+import cli
+from src.codegen import CodeGenerator
+from src.compiler import Compiler
+
+
+def run_cli(monkeypatch, *args):
+    """Run cli.main with the given arguments and return its exit code."""
+    monkeypatch.setattr(sys, "argv", ["uhl-compile", "--no-cache", *map(str, args)])
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main()
+    return exc_info.value.code
+
+
+def test_compile_many_writes_next_to_inputs(tmp_path, monkeypatch):
+    """Test that several inputs without -o are each compiled next to their source."""
+    sources = {"first": "set x to 1", "second": "set y to 2"}
+    for name, source in sources.items():
+        (tmp_path / f"{name}.uhl").write_text(source, encoding="utf-8")
+
+    assert run_cli(monkeypatch, tmp_path / "first.uhl", tmp_path / "second.uhl") == 0
+
+    for name, source in sources.items():
+        expected = Compiler().compile(source)
+        assert (tmp_path / f"{name}.py").read_text(encoding="utf-8") == expected
+
+
+def test_compile_many_into_output_directory(tmp_path, monkeypatch):
+    """Test that several inputs with -o are compiled into that directory."""
+    (tmp_path / "a.uhl").write_text("set x to 1", encoding="utf-8")
+    (tmp_path / "b.uhl").write_text("set y to 2", encoding="utf-8")
+    out_dir = tmp_path / "build"
+
+    assert run_cli(monkeypatch, tmp_path / "a.uhl", tmp_path / "b.uhl", "-o", out_dir) == 0
+
+    assert sorted(path.name for path in out_dir.iterdir()) == ["a.py", "b.py"]
+
+
+def test_compile_many_rejects_colliding_outputs(tmp_path, monkeypatch, capsys):
+    """Test that inputs sharing a basename are not compiled over each other."""
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "p.uhl").write_text("set x to 1", encoding="utf-8")
+    out_dir = tmp_path / "out"
+
+    exit_code = run_cli(
+        monkeypatch, tmp_path / "a" / "p.uhl", tmp_path / "b" / "p.uhl", "-o", out_dir
+    )
+
+    assert exit_code == 1
+    assert "would both be compiled" in capsys.readouterr().err
+    assert not out_dir.exists()
+
+
+def test_compile_many_rejects_overwriting_an_input(tmp_path, monkeypatch, capsys):
+    """Test that an input already ending in .py is not compiled over itself."""
+    (tmp_path / "a.uhl").write_text("set x to 1", encoding="utf-8")
+    (tmp_path / "b.py").write_text("set y to 2", encoding="utf-8")
+
+    assert run_cli(monkeypatch, tmp_path / "a.uhl", tmp_path / "b.py") == 1
+
+    assert "would overwrite the input" in capsys.readouterr().err
+    assert (tmp_path / "b.py").read_text(encoding="utf-8") == "set y to 2"
+    assert not (tmp_path / "a.py").exists()
+
+
+def test_compile_many_reports_every_failure(tmp_path, monkeypatch, capsys):
+    """Test that an unexpected error in one file is reported without stopping the others."""
+    (tmp_path / "broken.uhl").mkdir()
+    (tmp_path / "good.uhl").write_text("set x to 1", encoding="utf-8")
+
+    assert run_cli(monkeypatch, tmp_path / "broken.uhl", tmp_path / "good.uhl") == 1
+
+    err = capsys.readouterr().err
+    assert f"Compilation Error in {tmp_path / 'broken.uhl'}" in err
+    assert f"Compiled successfully: {tmp_path / 'good.uhl'}" in err
+    assert (tmp_path / "good.py").exists()
+
+
+def test_failed_codegen_keeps_previous_output(tmp_path, monkeypatch):
+    """Test that an error during code generation leaves the old output file intact."""
+    (tmp_path / "p.uhl").write_text("set x to 1", encoding="utf-8")
+    out_file = tmp_path / "p.py"
+    out_file.write_text("previous = 1\n", encoding="utf-8")
+
+    def failing_write_program(_self, _program, out):
+        out.write("partial")
+        raise ValueError("codegen failed")
+
+    monkeypatch.setattr(CodeGenerator, "write_program", failing_write_program)
+
+    assert run_cli(monkeypatch, tmp_path / "p.uhl", "-o", out_file) == 1
+
+    assert out_file.read_text(encoding="utf-8") == "previous = 1\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["p.py", "p.uhl"]
@@ -0,0 +1,121 @@
+"""Tests for the compiler orchestrator."""
+
+import io
+import types
+from pathlib import Path
+
+from src import compiler as compiler_module
+from src.ast import Assignment, BinaryOp, Identifier, Program, Statement
+from src.codegen import CodeGenerator
+from src.compiler import Compiler, ast_cache_key
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+
+def test_ast_cache_round_trip(tmp_path):
+    """Test that a cached AST compiles to the same code as a fresh parse."""
+    source_code = (EXAMPLES_DIR / "loops.uhl").read_text(encoding="utf-8")
+    expected = Compiler().compile(source_code)
+
+    assert Compiler(cache_dir=str(tmp_path)).compile(source_code) == expected
+    assert len(list(tmp_path.glob("*.ast.pkl"))) == 1
+
+    compiler = Compiler(cache_dir=str(tmp_path))
+    assert compiler.compile(source_code) == expected
+    assert compiler.parser is None
+
+
+def test_ast_cache_ignores_corrupt_entries(tmp_path):
+    """Test that an unreadable cache entry falls back to parsing."""
+    source_code = (EXAMPLES_DIR / "basic.uhl").read_text(encoding="utf-8")
+    compiler = Compiler(cache_dir=str(tmp_path))
+    expected = compiler.compile(source_code)
+
+    for cache_file in tmp_path.glob("*.ast.pkl"):
+        cache_file.write_bytes(b"not a pickle")
+
+    assert Compiler(cache_dir=str(tmp_path)).compile(source_code) == expected
+
+
+def test_ast_cache_rejects_damaged_entries(tmp_path):
+    """Test that truncated, bit-flipped or garbage entries fall back to parsing."""
+    source_code = (EXAMPLES_DIR / "basic.uhl").read_text(encoding="utf-8")
+    expected = Compiler(cache_dir=str(tmp_path)).compile(source_code)
+    (cache_file,) = tmp_path.glob("*.ast.pkl")
+    entry = cache_file.read_bytes()
+
+    damaged = [entry[:length] for length in range(0, len(entry), 17)]
+    damaged += [
+        entry[:i] + bytes([entry[i] ^ (1 << (i % 8))]) + entry[i + 1 :]
+        for i in range(0, len(entry), 5)
+    ]
+    damaged.append(b"\x80\x05X\x04\x00\x00\x00\xff\xfe\xfd\xfc.")
+
+    for data in damaged:
+        cache_file.write_bytes(data)
+        assert Compiler(cache_dir=str(tmp_path)).compile(source_code) == expected
+
+
+def test_ast_cache_key_follows_compiler_sources(tmp_path, monkeypatch):
+    """Test that editing a module that shapes the AST changes the cache key."""
+    parser_file = tmp_path / "parser.py"
+    fake_parser = types.SimpleNamespace(__file__=str(parser_file))
+    monkeypatch.setattr(compiler_module, "_AST_CACHE_MODULES", (fake_parser,))
+
+    keys = []
+    try:
+        for source in ("old parser", "edited parser"):
+            parser_file.write_text(source, encoding="utf-8")
+            ast_cache_key.cache_clear()
+            keys.append(ast_cache_key())
+    finally:
+        ast_cache_key.cache_clear()
+
+    assert keys[0] != keys[1]
+
+
+def test_compile_long_operator_chains():
+    """Test that operator chains far deeper than the recursion limit compile."""
+    operands = [str(i) for i in range(5000)]
+    source_code = "set x to " + " plus ".join(operands) + "\nset y to " + "not " * 5000 + "z"
+
+    expected = "x = " + " + ".join(operands) + "\ny = " + "not " * 5000 + "z"
+    assert Compiler().compile(source_code) == expected
+
+
+def test_generate_operator_subclass():
+    """Test that a BinaryOp subclass without its own visitor still generates."""
+
+    class Pow(BinaryOp):
+        __slots__ = ()
+
+    program = Program([Assignment("x", Pow(Identifier("a"), "**", Identifier("b")))])
+
+    assert CodeGenerator().generate(program) == "x = a ** b"
+
+
+def test_generate_skips_statements_without_code():
+    """Test that a statement generating no code leaves no blank line."""
+
+    class Note(Statement):
+        __slots__ = ()
+
+        def accept(self, _visitor):
+            return ""
+
+    program = Program([Assignment("x", Identifier("a")), Note(), Assignment("y", Identifier("b"))])
+    out = io.StringIO()
+    CodeGenerator().write_program(program, out)
+
+    assert CodeGenerator().generate(program) == "x = a\ny = b"
+    assert out.getvalue() == "x = a\ny = b"
+
+
+def test_compile_to_streams_same_code():
+    """Test that streamed output matches compile()."""
+    source_code = (EXAMPLES_DIR / "complete.uhl").read_text(encoding="utf-8")
+    out = io.StringIO()
+
+    Compiler().compile_to(source_code, out)
+
+    assert out.getvalue() == Compiler().compile(source_code)
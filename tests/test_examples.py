@@ -2,31 +2,16 @@
 
 from pathlib import Path
 
-from src.compiler import Compiler
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
 
-
-def test_basic_uhl():
-    """Test that basic.uhl compiles to expected Python code."""
-    compiler = Compiler()
-    examples_dir = Path(__file__).parent.parent / "examples"
-    actual = compiler.compile_file(str(examples_dir / "basic.uhl"))
-
-    expected = """x = 5.0
+# Compiler output has no leading or trailing whitespace, so these compare as-is
+EXPECTED_BASIC = """x = 5.0
 name: str = 'Hello, World!'
 is_active: bool = True
 x = 10.0
 name = 'Python'"""
 
-    assert actual.strip() == expected.strip()
-
-
-def test_loops_uhl():
-    """Test that loops.uhl compiles to expected Python code."""
-    compiler = Compiler()
-    examples_dir = Path(__file__).parent.parent / "examples"
-    actual = compiler.compile_file(str(examples_dir / "loops.uhl"))
-
-    expected = """numbers = [1, 2, 3, 4, 5]
+EXPECTED_LOOPS = """numbers = [1, 2, 3, 4, 5]
 for number in numbers:
     squared = number * number
     squared = squared + 1
@@ -37,16 +22,7 @@ for number in numbers:
             message = 'Iteration'
             message = message"""
 
-    assert actual.strip() == expected.strip()
-
-
-def test_complete_uhl():
-    """Test that complete.uhl compiles to expected Python code."""
-    compiler = Compiler()
-    examples_dir = Path(__file__).parent.parent / "examples"
-    actual = compiler.compile_file(str(examples_dir / "complete.uhl"))
-
-    expected = """total: int = 0
+EXPECTED_COMPLETE = """total: int = 0
 numbers: list = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 for number in numbers:
     total = total + number
@@ -62,4 +38,17 @@ for number in numbers:
             is_done: bool = total > 50
             final_result = average * 2 + 10"""
 
-    assert actual.strip() == expected.strip()
+
+def test_basic_uhl(compile_cached):
+    """Test that basic.uhl compiles to expected Python code."""
+    assert compile_cached(str(EXAMPLES_DIR / "basic.uhl")) == EXPECTED_BASIC
+
+
+def test_loops_uhl(compile_cached):
+    """Test that loops.uhl compiles to expected Python code."""
+    assert compile_cached(str(EXAMPLES_DIR / "loops.uhl")) == EXPECTED_LOOPS
+
+
+def test_complete_uhl(compile_cached):
+    """Test that complete.uhl compiles to expected Python code."""
+    assert compile_cached(str(EXAMPLES_DIR / "complete.uhl")) == EXPECTED_COMPLETE
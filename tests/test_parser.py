@@ -0,0 +1,13 @@
+"""Tests for the parser."""
+
+from src.codegen import CodeGenerator
+from src.lexer import Lexer
+from src.parser import Parser
+
+
+def test_small_number_literals_keep_their_type():
+    """Test that cached small int literals are not used for equal floats."""
+    tokens = Lexer("set x to 1.0 plus 1 plus 300").tokenize()
+    program = Parser(tokens).parse()
+
+    assert CodeGenerator().generate(program) == "x = 1.0 + 1 + 300"